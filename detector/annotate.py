@@ -3,6 +3,7 @@
 Pure functions — no Qt or model dependency.
 """
 
+from functools import lru_cache
 from typing import List, Dict, Any
 import cv2
 import numpy as np
@@ -32,6 +33,32 @@ _PALETTE = [
 ]
 
 
+# Keywords that indicate a defective / bad classification result.
+_BAD_KEYWORDS = frozenset({"defect", "defective", "bad", "ng", "fail",
+                           "reject", "rejected", "nok", "damaged", "faulty"})
+
+# Colour constants (BGR)
+_CLR_DEFECT = (0, 0, 255)            # red
+_CLR_OK = (0, 200, 0)                # green
+_CLR_UNCLASSIFIED = (190, 190, 190)  # bright grey
+
+
+@lru_cache(maxsize=256)
+def is_defect_label(label: str, class_id: int = -1) -> bool:
+    """Return True if a classifier result denotes a defective part.
+
+    Matches *label* (case-insensitive) against known "bad" keywords.
+    Classifiers emit a handful of distinct labels, so results are
+    cached instead of re-scanning the keywords for every object.
+    """
+    label = label.lower()
+    if label in _BAD_KEYWORDS or any(k in label for k in _BAD_KEYWORDS):
+        return True
+    # Fallback for binary classifiers with numeric labels:
+    # class index 0 is conventionally the defect class.
+    return class_id == 0 and label in ("0", "class_0")
+
+
 def _colour_for_class(class_id: int) -> tuple:
     """Return a BGR colour for the given class ID."""
     return _PALETTE[class_id % len(_PALETTE)]
@@ -72,15 +99,6 @@ def draw_detections(
     np.ndarray
         Annotated copy of the frame.
     """
-    # Keywords that indicate a defective / bad classification result.
-    _bad_keywords = {"defect", "defective", "bad", "ng", "fail",
-                     "reject", "rejected", "nok", "damaged", "faulty"}
-
-    # Colour constants (BGR)
-    _CLR_DEFECT = (0, 0, 255)        # red
-    _CLR_OK = (0, 200, 0)            # green
-    _CLR_UNCLASSIFIED = (190, 190, 190)  # bright grey
-
     annotated = frame.copy()
 
     for det in detections:
@@ -95,17 +113,8 @@ def draw_detections(
         # ---- decide colour ------------------------------------------------
         if classification is not None:
             # Classified → red for defective, green for OK
-            cls_label = classification["label"].lower()
-            cls_id = classification.get("id", -1)
-            # Check label text against known "bad" keywords
-            is_defect = (
-                cls_label in _bad_keywords
-                or any(k in cls_label for k in _bad_keywords)
-            )
-            # Fallback for binary classifiers with numeric labels:
-            # class index 0 is conventionally the defect class.
-            if not is_defect and cls_id == 0 and cls_label in ("0", "class_0"):
-                is_defect = True
+            is_defect = is_defect_label(classification["label"],
+                                        classification.get("id", -1))
             colour = _CLR_DEFECT if is_defect else _CLR_OK
         elif classifier_active:
             # A classifier is loaded but this object hasn't been classified
@@ -82,6 +82,8 @@ class TimmImageClassifier:
         # Build data transforms from the model's pretrained config
         data_config = resolve_data_config(self.model.pretrained_cfg)
         self.transform = create_transform(**data_config, is_training=False)
+        # Longest side of the network input, in pixels
+        self.input_size: Optional[int] = max(data_config["input_size"][1:])
 
         # Class labels
         if class_names is None:
@@ -221,11 +223,26 @@ class TransformerImageClassifier:
         self.model = AutoModelForImageClassification.from_pretrained(self.model_name)
         self.model.to(self.device)
         self.model.eval()
+        # Longest side of the network input (None if the processor doesn't say)
+        self.input_size: Optional[int] = self._processor_input_size(self.processor)
 
         # Label mapping
         self.id2label = self.model.config.id2label
         self.label2id = self.model.config.label2id
 
+    @staticmethod
+    def _processor_input_size(processor) -> Optional[int]:
+        """Read the target size from an HF image processor's ``size`` config."""
+        size = getattr(processor, "size", None)
+        if isinstance(size, int):
+            return size
+        if isinstance(size, dict):
+            if "shortest_edge" in size:
+                return size["shortest_edge"]
+            if "height" in size and "width" in size:
+                return max(size["height"], size["width"])
+        return None
+
     @torch.no_grad()
     def predict(
         self,
@@ -138,6 +138,9 @@ class RFDETRDetector:
         self._model.optimize_for_inference()
         self.resolution = self._model.model_config.resolution
 
+        # Reused BGR→RGB scratch frame; predict() runs once per camera frame
+        self._rgb_buf: Optional[np.ndarray] = None
+
         # Build default class name map if not provided
         if self.class_names is None:
             self.class_names = [f"class_{i}" for i in range(num_classes)]
@@ -168,8 +171,10 @@ class RFDETRDetector:
         import cv2
 
         # RF-DETR expects a PIL RGB image
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        pil_img = Image.fromarray(rgb)
+        if self._rgb_buf is None or self._rgb_buf.shape != frame.shape:
+            self._rgb_buf = np.empty_like(frame)
+        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+        pil_img = Image.fromarray(rgb)  # PIL copies RGB data, so reuse is safe
 
         # supervision.Detections returned by rfdetr
         sv_detections = self._model.predict(pil_img, threshold=confidence_threshold)
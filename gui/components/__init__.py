@@ -1,7 +1,9 @@
 """Reusable UI components for the InspektLine GUI."""
 
+from .card import Card
 from .sidebar_button import SidebarButton
+from .video_container import VideoContainer
 from .video_label import VideoLabel
 
-__all__ = ['SidebarButton', 'VideoLabel']
+__all__ = ['Card', 'SidebarButton', 'VideoContainer', 'VideoLabel']
 
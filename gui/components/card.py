@@ -0,0 +1,80 @@
+"""Rounded card panel component."""
+
+from PySide6.QtWidgets import QFrame, QVBoxLayout
+from PySide6.QtCore import Qt, QRect, QRectF
+from PySide6.QtGui import QPainter, QPixmap, QPixmapCache, QColor, QPen
+from gui.styles import DarkTheme
+
+
+def _rounded_patch(bg: str, border: str, radius: int, dpr: float) -> QPixmap:
+    """Rasterise a minimal rounded rect once per (colour, radius, dpr).
+
+    Held in the application-wide ``QPixmapCache`` so every card (and any
+    other component with the same look) shares one pixmap.
+    """
+    key = f"card-patch:{bg}:{border}:{radius}:{dpr}"
+    cached = QPixmapCache.find(key)
+    if cached is not None:
+        return cached
+
+    size = 2 * radius + 3  # 1px stretchable centre between the corners
+    pm = QPixmap(int(size * dpr), int(size * dpr))
+    pm.setDevicePixelRatio(dpr)
+    pm.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(pm)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setPen(QPen(QColor(border), 1))
+    painter.setBrush(QColor(bg))
+    painter.drawRoundedRect(QRectF(0.5, 0.5, size - 1, size - 1), radius, radius)
+    painter.end()
+    QPixmapCache.insert(key, pm)
+    return pm
+
+
+def _draw_nine_patch(painter: QPainter, rect: QRect, pm: QPixmap, m: int):
+    """Blit *pm* into *rect*: corners as-is, edges and centre stretched."""
+    dpr = pm.devicePixelRatio()
+    pw = round(pm.width() / dpr)
+    ph = round(pm.height() / dpr)
+    xs = (0, m, pw - m, pw)
+    ys = (0, m, ph - m, ph)
+    txs = (rect.left(), rect.left() + m, rect.right() + 1 - m, rect.right() + 1)
+    tys = (rect.top(), rect.top() + m, rect.bottom() + 1 - m, rect.bottom() + 1)
+    for row in range(3):
+        for col in range(3):
+            target = QRectF(txs[col], tys[row],
+                            txs[col + 1] - txs[col], tys[row + 1] - tys[row])
+            if target.width() <= 0 or target.height() <= 0:
+                continue
+            source = QRectF(xs[col] * dpr, ys[row] * dpr,
+                            (xs[col + 1] - xs[col]) * dpr,
+                            (ys[row + 1] - ys[row]) * dpr)
+            painter.drawPixmap(target, pm, source)
+
+
+class Card(QFrame):
+    """Rounded panel with its own vertical layout.
+
+    The rounded background is a small pre-rendered pixmap stretched as a
+    9-patch in ``paintEvent`` instead of a QSS ``border-radius``, so resizes
+    blit a cached texture rather than re-rasterising a rounded path.
+    Layout-related styling (padding) still comes from the global
+    ``QFrame#card`` rule in ``DarkTheme.get_main_window_style()``.
+    Add children through ``card.body``.
+    """
+
+    RADIUS = 10
+
+    def __init__(self, margins=15, spacing=12, parent=None):
+        super().__init__(parent)
+        self.setObjectName("card")
+        self.body = QVBoxLayout(self)
+        self.body.setContentsMargins(margins, margins, margins, margins)
+        self.body.setSpacing(spacing)
+
+    def paintEvent(self, event) -> None:
+        pm = _rounded_patch(DarkTheme.BG_SECONDARY, DarkTheme.BORDER_PRIMARY,
+                            self.RADIUS, self.devicePixelRatioF())
+        painter = QPainter(self)
+        _draw_nine_patch(painter, self.rect(), pm, self.RADIUS + 1)
+        painter.end()
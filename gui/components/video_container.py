@@ -0,0 +1,44 @@
+"""Rounded container for the live video feed."""
+
+from PySide6.QtWidgets import QWidget
+from PySide6.QtCore import QRectF
+from PySide6.QtGui import QPainter, QPainterPath, QColor, QPen
+from gui.styles import DarkTheme
+
+
+class VideoContainer(QWidget):
+    """Rounded panel that hosts the video label and its info bar.
+
+    The container sits behind a widget that repaints at camera frame rate,
+    so its rounded background is painted from a ``QPainterPath`` built once
+    per size in ``resizeEvent`` instead of by the QSS style engine on every
+    repaint.  Children still get the panel colour through a descendant-only
+    stylesheet rule.
+    """
+
+    def __init__(self, radius=8, parent=None):
+        super().__init__(parent)
+        self.setObjectName("videoContainer")
+        self.setStyleSheet(
+            f"#videoContainer QWidget {{ background-color: {DarkTheme.BG_SECONDARY}; }}"
+        )
+        self._radius = radius
+        self._bg = QColor(DarkTheme.BG_SECONDARY)
+        self._pen = QPen(QColor(DarkTheme.BORDER_PRIMARY), 1)
+        self._path = QPainterPath()
+
+    def resizeEvent(self, event) -> None:
+        super().resizeEvent(event)
+        self._path = QPainterPath()
+        self._path.addRoundedRect(
+            QRectF(self.rect()).adjusted(0.5, 0.5, -0.5, -0.5),
+            self._radius, self._radius,
+        )
+
+    def paintEvent(self, event) -> None:
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(self._pen)
+        painter.setBrush(self._bg)
+        painter.drawPath(self._path)
+        painter.end()
@@ -4,9 +4,16 @@ import time
 from collections import deque
 from typing import List, Tuple, Optional
 
+import numpy as np
 from PySide6.QtWidgets import QLabel
-from PySide6.QtCore import Qt, Signal, QPointF
-from PySide6.QtGui import QImage, QPixmap, QMouseEvent, QPainter, QPen, QColor, QPolygonF
+from PySide6.QtCore import Qt, Signal, QPointF, QRect
+from PySide6.QtGui import QImage, QMouseEvent, QPainter, QPen, QColor, QPolygonF
+
+
+# ROI overlay pens/brush — reused on every repaint while drawing
+_ROI_COLOR = QColor(0, 255, 255)
+_ROI_PEN = QPen(_ROI_COLOR, 2)
+_ROI_PREVIEW_PEN = QPen(QColor(0, 255, 255, 150), 1, Qt.PenStyle.DashLine)
 
 
 class VideoLabel(QLabel):
@@ -36,8 +43,16 @@ class VideoLabel(QLabel):
         self._frame_w: int = 0
         self._frame_h: int = 0
 
-        # Cached scaled pixmap geometry (updated each display_frame)
-        self._pixmap_rect: Optional[tuple] = None  # (x_off, y_off, pw, ph)
+        # Latest frame, painted directly in paintEvent.  The numpy buffer
+        # is kept alive alongside the QImage that wraps it (no copy).
+        self._frame_buf = None
+        self._image: Optional[QImage] = None
+        # Array last passed in, to skip re-wrapping and repainting it
+        self._source_frame = None
+
+        # Target rect of the image inside the widget (updated on new frame
+        # size / resize) — (x_off, y_off, pw, ph)
+        self._pixmap_rect: Optional[tuple] = None
 
         # ROI drawing state
         self._draw_mode: bool = False
@@ -66,6 +81,7 @@ class VideoLabel(QLabel):
             self.setCursor(Qt.CursorShape.ArrowCursor)
             self._roi_points_widget.clear()
             self._mouse_pos = None
+        self.update()  # overlay repaints on its own, not only on new frames
 
     # ---- FPS ---------------------------------------------------------------
 
@@ -81,48 +97,72 @@ class VideoLabel(QLabel):
     # ---- frame display -----------------------------------------------------
 
     def display_frame(self, frame):
-        """Display a video frame (BGR numpy array)."""
-        if frame is None:
-            return
+        """Display a video frame (BGR numpy array, H×W×3 uint8).
 
-        self._update_fps()
+        The array is referenced, not copied, until the next frame arrives;
+        callers must not write into it afterwards.
+        """
+        if frame is None or frame is self._source_frame:
+            return  # nothing new (display ticks outpace the camera)
+        if not self.isVisible():
+            return  # hidden (e.g. page swapped out) — nothing would be painted
+        self._source_frame = frame
 
-        import cv2
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        self._update_fps()
 
-        height, width, channels = frame_rgb.shape
+        # Qt reads BGR directly — no colour-converted copy of the frame.
+        # Producers publish a fresh array per frame, so it can be wrapped.
+        if not frame.flags["C_CONTIGUOUS"]:
+            frame = np.ascontiguousarray(frame)
+        height, width = frame.shape[:2]
+        size_changed = (width, height) != (self._frame_w, self._frame_h)
         self._frame_w = width
         self._frame_h = height
-        bytes_per_line = channels * width
 
-        q_image = QImage(
-            frame_rgb.data,
+        # Wrap the buffer without copying; it is scaled at paint time
+        self._frame_buf = frame
+        self._image = QImage(
+            frame.data,
             width,
             height,
-            bytes_per_line,
-            QImage.Format.Format_RGB888,
+            frame.strides[0],
+            QImage.Format.Format_BGR888,
         )
 
-        pixmap = QPixmap.fromImage(q_image)
-        scaled_pixmap = pixmap.scaled(
-            self.size(),
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.FastTransformation,
-        )
+        if size_changed or self._pixmap_rect is None:
+            self._update_image_rect()
+        self.update()
 
-        # Cache the offset / size so we can map mouse coords → frame coords
-        pw, ph = scaled_pixmap.width(), scaled_pixmap.height()
+    def _update_image_rect(self):
+        """Fit the frame into the widget, keeping aspect ratio, centred."""
+        if self._frame_w == 0 or self._frame_h == 0:
+            self._pixmap_rect = None
+            return
+        scale = min(self.width() / self._frame_w, self.height() / self._frame_h)
+        pw = max(1, int(self._frame_w * scale))
+        ph = max(1, int(self._frame_h * scale))
         x_off = (self.width() - pw) // 2
         y_off = (self.height() - ph) // 2
         self._pixmap_rect = (x_off, y_off, pw, ph)
 
+    def resizeEvent(self, event) -> None:
+        super().resizeEvent(event)
+        self._update_image_rect()
+
+    def paintEvent(self, event) -> None:
+        super().paintEvent(event)  # stylesheet background
+        if self._image is None or self._pixmap_rect is None:
+            return
+
+        x_off, y_off, pw, ph = self._pixmap_rect
+        painter = QPainter(self)
+        painter.drawImage(QRect(x_off, y_off, pw, ph), self._image)
+
         # If we are in draw mode, paint the in-progress polygon on top
         if self._draw_mode and self._roi_points_widget:
-            painter = QPainter(scaled_pixmap)
+            painter.translate(x_off, y_off)
             self._paint_roi_overlay(painter, x_off, y_off, pw, ph)
-            painter.end()
-
-        self.setPixmap(scaled_pixmap)
+        painter.end()
 
     # ---- coordinate mapping ------------------------------------------------
 
@@ -133,7 +173,7 @@ class VideoLabel(QLabel):
 
         x_off, y_off, pw, ph = self._pixmap_rect
 
-        # Position relative to the scaled pixmap
+        # Position relative to the displayed image
         rx = pos.x() - x_off
         ry = pos.y() - y_off
 
@@ -149,15 +189,14 @@ class VideoLabel(QLabel):
             max(0, min(fy, self._frame_h - 1)),
         )
 
-    # ---- ROI overlay painting (on the pixmap, in widget coords) -----------
+    # ---- ROI overlay painting (image-local coords) ------------------------
 
     def _paint_roi_overlay(self, painter: QPainter, x_off: int, y_off: int,
                            pw: int, ph: int):
         """Draw the in-progress polygon vertices and edges."""
-        pen = QPen(QColor(0, 255, 255), 2)
-        painter.setPen(pen)
+        painter.setPen(_ROI_PEN)
 
-        # Translate widget points to pixmap-local coords
+        # Translate widget points to image-local coords
         pts = []
         for wp in self._roi_points_widget:
             px = wp.x() - x_off
@@ -172,13 +211,12 @@ class VideoLabel(QLabel):
         if self._mouse_pos is not None and pts:
             mp = QPointF(self._mouse_pos.x() - x_off,
                          self._mouse_pos.y() - y_off)
-            dash_pen = QPen(QColor(0, 255, 255, 150), 1, Qt.PenStyle.DashLine)
-            painter.setPen(dash_pen)
+            painter.setPen(_ROI_PREVIEW_PEN)
             painter.drawLine(pts[-1], mp)
-            painter.setPen(pen)
+            painter.setPen(_ROI_PEN)
 
         # Draw vertex dots
-        painter.setBrush(QColor(0, 255, 255))
+        painter.setBrush(_ROI_COLOR)
         for p in pts:
             painter.drawEllipse(p, 4, 4)
 
@@ -201,6 +239,7 @@ class VideoLabel(QLabel):
             if frame_pt is None:
                 return
             self._roi_points_widget.append(pos)
+            self.update()
 
     def mouseDoubleClickEvent(self, event: QMouseEvent) -> None:
         if not self._draw_mode:
@@ -211,6 +250,7 @@ class VideoLabel(QLabel):
     def mouseMoveEvent(self, event: QMouseEvent) -> None:
         if self._draw_mode:
             self._mouse_pos = event.position()
+            self.update()
         super().mouseMoveEvent(event)
 
     def _finish_polygon(self) -> None:
@@ -218,6 +258,7 @@ class VideoLabel(QLabel):
         if len(self._roi_points_widget) < 3:
             # Need at least 3 vertices
             self._roi_points_widget.clear()
+            self.update()
             return
 
         # Convert all widget points to frame coordinates
@@ -232,6 +273,7 @@ class VideoLabel(QLabel):
         self.setCursor(Qt.CursorShape.ArrowCursor)
         self._roi_points_widget.clear()
         self._mouse_pos = None
+        self.update()
 
         if len(frame_points) >= 3:
             self.roi_polygon_drawn.emit(frame_points)
@@ -57,6 +57,11 @@ class MainWindow(QMainWindow):
 
         self._frame_count = 0
         self._resolution_set = False
+        # Frame pushed on the previous tick — an identical object means the
+        # camera / inference thread has not produced anything new since
+        self._last_frame = None
+        # Last classification log version pushed to the home page
+        self._log_version = -1
 
         # Dialog references (keep alive while open)
         self._dialogs: dict[str, PageDialog | None] = {
@@ -146,46 +151,45 @@ class MainWindow(QMainWindow):
 
         if display_frame is None:
             return  # camera not producing frames yet
+        if display_frame is self._last_frame:
+            return  # nothing new since the last tick — skip the UI work
+        self._last_frame = display_frame
 
         self._frame_count += 1
 
-        # Push frame to home page video label
-        if hasattr(self.home_page, "video_label") and self.home_page.video_label:
-            self.home_page.video_label.display_frame(display_frame)
-            if not self._resolution_set and hasattr(self.home_page, "resolution_value"):
-                h, w = display_frame.shape[:2]
-                self.home_page.resolution_value.setText(f"{w}×{h}")
-                self._resolution_set = True
+        # Push frame to the home page — it is always a HomePage, so its
+        # widgets and update_* hooks are accessed directly each tick.
+        home = self.home_page
+        home.video_label.display_frame(display_frame)
+        if not self._resolution_set:
+            h, w = display_frame.shape[:2]
+            home.queue_stat("resolution", f"{w}×{h}")
+            self._resolution_set = True
 
-            # Update real-time FPS display
-            if hasattr(self.home_page, "fps_value"):
-                fps = self.home_page.video_label.fps
-                self.home_page.fps_value.setText(f"{fps:.1f}")
+        # Update real-time FPS display (coalesced by the home page)
+        home.queue_stat("fps", f"{home.video_label.fps:.1f}")
 
         # Update detection count on home page
-        if detections and hasattr(self.home_page, "update_detection_count"):
-            self.home_page.update_detection_count(len(detections))
+        if detections:
+            home.update_detection_count(len(detections))
 
         # Update ROI zone count on home page
-        if self.inspection_service.has_roi_polygon:
-            if hasattr(self.home_page, "update_zone_counts"):
-                self.home_page.update_zone_counts(
-                    self.inspection_service.zone_count,
-                    self.inspection_service.total_entered,
-                )
-
-            # Update two-stage classification log
-            if self.inspection_service.has_classifier:
-                log = self.inspection_service.classification_log
-                if log and hasattr(self.home_page, "update_classification_log"):
-                    self.home_page.update_classification_log(log)
+        svc = self.inspection_service
+        if svc.has_roi_polygon:
+            home.update_zone_counts(svc.zone_count, svc.total_entered)
+
+            # Update two-stage classification log (snapshot only on change)
+            if svc.has_classifier:
+                version = svc.classification_log_version
+                if version != self._log_version:
+                    self._log_version = version
+                    log = svc.classification_log
+                    if log:
+                        home.update_classification_log(log)
 
         # Update dataset collection status
         if self.dataset_service.is_collecting:
-            if hasattr(self.home_page, "update_collection_status"):
-                self.home_page.update_collection_status(
-                    self.dataset_service.frames_saved
-                )
+            home.update_collection_status(self.dataset_service.frames_saved)
 
     # ================================================================
     # Window-opening helpers
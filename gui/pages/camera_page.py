@@ -1,12 +1,122 @@
 """Camera feed page."""
 
+from functools import lru_cache
+
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                                 QPushButton)
-from PySide6.QtCore import Qt
-from gui.components import VideoLabel
+from PySide6.QtCore import Qt, QRect, QRectF
+from PySide6.QtGui import (QColor, QFont, QFontMetrics, QPainter, QPixmap,
+                           QPixmapCache)
+from gui.components import VideoContainer, VideoLabel
 from gui.styles import StyleSheets, DarkTheme
 
 
+# Static stylesheets — built once at import instead of per page instance
+# Sizes live in QSS (min/max pairs) instead of per-widget setFixed*() calls
+_ICON_BTN_QSS = StyleSheets.get_icon_button_style() + """
+    QPushButton {
+        min-width: 40px; max-width: 40px;
+        min-height: 40px; max-height: 40px;
+    }
+"""
+
+_CAMERA_ICON_QSS = "font-size: 24px;"
+_TITLE_QSS = "font-size: 20px; font-weight: bold; color: #fff;"
+
+_INFO_OVERLAY_QSS = "background-color: rgba(0, 0, 0, 180); border-radius: 6px;"
+_STATUS_INDICATOR_QSS = f"color: {DarkTheme.SUCCESS}; font-size: 16px;"
+_OVERLAY_KEY_QSS = f"color: {DarkTheme.TEXT_SECONDARY}; font-size: 11px;"
+_OVERLAY_VALUE_QSS = f"color: {DarkTheme.TEXT_PRIMARY}; font-size: 12px; font-weight: bold;"
+_RES_LABEL_QSS = f"color: {DarkTheme.TEXT_SECONDARY}; font-size: 11px; margin-left: 15px;"
+
+_BOTTOM_PANEL_QSS = f"""
+    QWidget {{
+        background-color: {DarkTheme.BG_CARD};
+        border-radius: 8px;
+    }}
+"""
+
+_START_BTN_QSS = f"""
+    QPushButton {{
+        background-color: {DarkTheme.PRIMARY};
+        color: white;
+        border: none;
+        border-radius: 8px;
+        font-size: 16px;
+        font-weight: bold;
+        padding: 0 20px;
+        min-height: 50px;
+        max-height: 50px;
+    }}
+    QPushButton:hover {{
+        background-color: {DarkTheme.PRIMARY_HOVER};
+    }}
+    QPushButton:pressed {{
+        background-color: {DarkTheme.PRIMARY_PRESSED};
+    }}
+"""
+
+
+def _render_badge(text, bg, fg):
+    """Paint a small rounded status badge once and reuse the pixmap.
+
+    Cached in the shared ``QPixmapCache`` so reopened pages reuse it.
+    """
+    key = f"badge:{text}:{bg}:{fg}"
+    cached = QPixmapCache.find(key)
+    if cached is not None:
+        return cached
+
+    font = QFont()
+    font.setPixelSize(12)
+    font.setBold(True)
+    metrics = QFontMetrics(font)
+    w = metrics.horizontalAdvance(text) + 16  # 8px horizontal padding
+    h = metrics.height() + 6                  # 3px vertical padding
+
+    pixmap = QPixmap(w, h)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(QColor(bg))
+    painter.drawRoundedRect(QRectF(0, 0, w, h), 3, 3)
+    painter.setPen(QColor(fg))
+    painter.setFont(font)
+    painter.drawText(QRect(0, 0, w, h), Qt.AlignmentFlag.AlignCenter, text)
+    painter.end()
+    QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+# QSS min/max sizes apply to the content box, so the square variant drops
+# the horizontal padding to stay 50×50 overall.
+_SQUARE_SIZE_QSS = ("padding: 0; min-width: 50px; max-width: 50px; "
+                    "min-height: 50px; max-height: 50px;")
+_ROW_HEIGHT_QSS = "padding: 0 20px; min-height: 50px; max-height: 50px;"
+
+
+@lru_cache(maxsize=None)
+def _control_button_qss(text_color, is_square):
+    """Stylesheet for a bottom-row control button (one string per variant)."""
+    return f"""
+    QPushButton {{
+        background-color: {DarkTheme.BG_HOVER};
+        color: {text_color};
+        border: none;
+        border-radius: 8px;
+        font-size: {'18px' if is_square else '14px'};
+        {_SQUARE_SIZE_QSS if is_square else _ROW_HEIGHT_QSS}
+    }}
+    QPushButton:hover {{
+        background-color: {DarkTheme.BG_HOVER};
+    }}
+    QPushButton:pressed {{
+        background-color: {DarkTheme.BG_INPUT};
+    }}
+"""
+
+
 class CameraPage(QWidget):
     """Main camera feed page with controls.
 
@@ -40,73 +150,44 @@ class CameraPage(QWidget):
     def create_header(self):
         """Create the page header with title and controls."""
         header_layout = QHBoxLayout()
-
-        title_widget = QWidget()
-        title_layout = QHBoxLayout(title_widget)
-        title_layout.setContentsMargins(0, 0, 0, 0)
-        title_layout.setSpacing(10)
+        header_layout.setSpacing(10)
 
         camera_icon = QLabel("📹")
-        camera_icon.setStyleSheet("font-size: 24px;")
-        title_layout.addWidget(camera_icon)
+        camera_icon.setStyleSheet(_CAMERA_ICON_QSS)
+        header_layout.addWidget(camera_icon)
 
         title_label = QLabel("Camera Feed")
-        title_label.setStyleSheet("font-size: 20px; font-weight: bold; color: #fff;")
-        title_layout.addWidget(title_label)
-
-        live_badge = QLabel("LIVE")
-        live_badge.setStyleSheet(f"""
-            background-color: {DarkTheme.SUCCESS};
-            color: #000;
-            padding: 3px 8px;
-            border-radius: 3px;
-            font-size: 12px;
-            font-weight: bold;
-        """)
-        title_layout.addWidget(live_badge)
-        title_layout.addStretch()
-
-        header_layout.addWidget(title_widget)
-        header_layout.addStretch()
+        title_label.setStyleSheet(_TITLE_QSS)
+        header_layout.addWidget(title_label)
 
-        control_buttons_layout = QHBoxLayout()
-        control_buttons_layout.setSpacing(10)
+        live_badge = QLabel()
+        live_badge.setPixmap(_render_badge("LIVE", DarkTheme.SUCCESS, "#000"))
+        header_layout.addWidget(live_badge)
+        header_layout.addStretch()
 
         zoom_in_btn = QPushButton("🔍")
-        zoom_in_btn.setFixedSize(40, 40)
-        zoom_in_btn.setStyleSheet(StyleSheets.get_icon_button_style())
-        control_buttons_layout.addWidget(zoom_in_btn)
+        zoom_in_btn.setStyleSheet(_ICON_BTN_QSS)
+        header_layout.addWidget(zoom_in_btn)
 
         zoom_out_btn = QPushButton("🔎")
-        zoom_out_btn.setFixedSize(40, 40)
-        zoom_out_btn.setStyleSheet(StyleSheets.get_icon_button_style())
-        control_buttons_layout.addWidget(zoom_out_btn)
+        zoom_out_btn.setStyleSheet(_ICON_BTN_QSS)
+        header_layout.addWidget(zoom_out_btn)
 
         refresh_btn = QPushButton("🔄")
-        refresh_btn.setFixedSize(40, 40)
-        refresh_btn.setStyleSheet(StyleSheets.get_icon_button_style())
+        refresh_btn.setStyleSheet(_ICON_BTN_QSS)
         if self._parent_window and hasattr(self._parent_window, "refresh_camera"):
             refresh_btn.clicked.connect(self._parent_window.refresh_camera)
-        control_buttons_layout.addWidget(refresh_btn)
+        header_layout.addWidget(refresh_btn)
 
         fullscreen_btn = QPushButton("⛶")
-        fullscreen_btn.setFixedSize(40, 40)
-        fullscreen_btn.setStyleSheet(StyleSheets.get_icon_button_style())
-        control_buttons_layout.addWidget(fullscreen_btn)
+        fullscreen_btn.setStyleSheet(_ICON_BTN_QSS)
+        header_layout.addWidget(fullscreen_btn)
 
-        header_layout.addLayout(control_buttons_layout)
         return header_layout
 
     def create_video_container(self):
         """Create the video display container."""
-        video_container = QWidget()
-        video_container.setStyleSheet(f"""
-            QWidget {{
-                background-color: {DarkTheme.BG_SECONDARY};
-                border: 1px solid {DarkTheme.BORDER_PRIMARY};
-                border-radius: 8px;
-            }}
-        """)
+        video_container = VideoContainer()
         video_layout = QVBoxLayout(video_container)
         video_layout.setContentsMargins(10, 10, 10, 10)
 
@@ -121,7 +202,7 @@ class CameraPage(QWidget):
     def create_info_overlay(self):
         """Create an info overlay showing frame details."""
         overlay = QWidget()
-        overlay.setStyleSheet("background-color: rgba(0, 0, 0, 180); border-radius: 6px;")
+        overlay.setStyleSheet(_INFO_OVERLAY_QSS)
         overlay.setMaximumHeight(40)
 
         overlay_layout = QHBoxLayout(overlay)
@@ -129,29 +210,29 @@ class CameraPage(QWidget):
         overlay_layout.setSpacing(20)
 
         self.status_indicator = QLabel("●")
-        self.status_indicator.setStyleSheet(f"color: {DarkTheme.SUCCESS}; font-size: 16px;")
+        self.status_indicator.setStyleSheet(_STATUS_INDICATOR_QSS)
         overlay_layout.addWidget(self.status_indicator)
 
         status_text = QLabel("Connected")
-        status_text.setStyleSheet(f"color: {DarkTheme.TEXT_PRIMARY}; font-size: 12px; font-weight: bold;")
+        status_text.setStyleSheet(_OVERLAY_VALUE_QSS)
         overlay_layout.addWidget(status_text)
 
         overlay_layout.addStretch()
 
         fps_label = QLabel("FPS:")
-        fps_label.setStyleSheet(f"color: {DarkTheme.TEXT_SECONDARY}; font-size: 11px;")
+        fps_label.setStyleSheet(_OVERLAY_KEY_QSS)
         overlay_layout.addWidget(fps_label)
 
         self.fps_value = QLabel("30")
-        self.fps_value.setStyleSheet(f"color: {DarkTheme.TEXT_PRIMARY}; font-size: 12px; font-weight: bold;")
+        self.fps_value.setStyleSheet(_OVERLAY_VALUE_QSS)
         overlay_layout.addWidget(self.fps_value)
 
         res_label = QLabel("Resolution:")
-        res_label.setStyleSheet(f"color: {DarkTheme.TEXT_SECONDARY}; font-size: 11px; margin-left: 15px;")
+        res_label.setStyleSheet(_RES_LABEL_QSS)
         overlay_layout.addWidget(res_label)
 
         self.resolution_value = QLabel("1920×1080")
-        self.resolution_value.setStyleSheet(f"color: {DarkTheme.TEXT_PRIMARY}; font-size: 12px; font-weight: bold;")
+        self.resolution_value.setStyleSheet(_OVERLAY_VALUE_QSS)
         overlay_layout.addWidget(self.resolution_value)
 
         return overlay
@@ -159,12 +240,7 @@ class CameraPage(QWidget):
     def create_bottom_panel(self):
         """Create the bottom control panel with buttons."""
         panel = QWidget()
-        panel.setStyleSheet(f"""
-            QWidget {{
-                background-color: {DarkTheme.BG_CARD};
-                border-radius: 8px;
-            }}
-        """)
+        panel.setStyleSheet(_BOTTOM_PANEL_QSS)
         panel_layout = QVBoxLayout(panel)
         panel_layout.setContentsMargins(20, 15, 20, 15)
         panel_layout.setSpacing(15)
@@ -180,24 +256,8 @@ class CameraPage(QWidget):
         buttons_layout.setSpacing(15)
 
         start_btn = QPushButton("▶ Start Inspection")
-        start_btn.setFixedHeight(50)
-        start_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {DarkTheme.PRIMARY};
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-size: 16px;
-                font-weight: bold;
-                padding: 0 20px;
-            }}
-            QPushButton:hover {{
-                background-color: {DarkTheme.PRIMARY_HOVER};
-            }}
-            QPushButton:pressed {{
-                background-color: {DarkTheme.PRIMARY_PRESSED};
-            }}
-        """)
+        start_btn.setStyleSheet(_START_BTN_QSS)
+
         if self._parent_window and hasattr(self._parent_window, "toggle_inspection"):
             start_btn.clicked.connect(self._parent_window.toggle_inspection)
         buttons_layout.addWidget(start_btn, stretch=2)
@@ -218,27 +278,7 @@ class CameraPage(QWidget):
     def create_control_button(self, text, is_square=False, color=None):
         """Create a control button."""
         btn = QPushButton(text)
-        if is_square:
-            btn.setFixedSize(50, 50)
-        else:
-            btn.setFixedHeight(50)
-
-        text_color = color if color else "white"
-        btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {DarkTheme.BG_HOVER};
-                color: {text_color};
-                border: none;
-                border-radius: 8px;
-                font-size: {'18px' if is_square else '14px'};
-                padding: 0 20px;
-            }}
-            QPushButton:hover {{
-                background-color: {DarkTheme.BG_HOVER};
-            }}
-            QPushButton:pressed {{
-                background-color: {DarkTheme.BG_INPUT};
-            }}
-        """)
+        btn.setStyleSheet(_control_button_qss(color or "white", is_square))
+
         return btn
 
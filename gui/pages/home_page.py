@@ -1,15 +1,371 @@
 """Home page — camera feed with inspection controls always visible."""
 
+import time
+from functools import partial
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QFrame, QFileDialog, QSizePolicy, QComboBox, QSpinBox,
-    QListWidget, QListWidgetItem, QAbstractItemView,
+    QListView, QAbstractItemView,
 )
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QColor
+from PySide6.QtCore import Qt, Signal, QTimer, QAbstractListModel, QModelIndex
+from PySide6.QtGui import QColor, QKeySequence, QShortcut
 
-from gui.components import VideoLabel
+from detector.annotate import is_defect_label
+from gui.components import VideoContainer, VideoLabel
 from gui.styles.themes import DarkTheme
+from gui.workers import run_in_background
+
+
+# Status labels are coloured through their ``status`` dynamic property
+# ("muted" / "ok" / "warn" / "error"), so a state change re-polishes one
+# label instead of parsing a new stylesheet for it.
+_STATUS_RULES_QSS = f"""
+    QLabel[status="muted"] {{
+        color: {DarkTheme.TEXT_SECONDARY}; font-size: 12px; border: none;
+    }}
+    QLabel[status="ok"] {{
+        color: {DarkTheme.SUCCESS}; font-size: 12px; border: none;
+    }}
+    QLabel[status="warn"] {{
+        color: {DarkTheme.WARNING}; font-size: 12px; border: none;
+    }}
+    QLabel[status="error"] {{
+        color: {DarkTheme.ERROR}; font-size: 12px; border: none;
+    }}
+    QLabel#smallStatus {{
+        font-size: 11px;
+    }}
+"""
+
+# Model-path label lives inside the model card, outside the panel rules
+_STATUS_ERROR_QSS = f"color: {DarkTheme.ERROR}; font-size: 12px; border: none;"
+
+# One stylesheet for the whole side panel; children pick their look by
+# objectName instead of each carrying an inline stylesheet.
+_SIDE_PANEL_QSS = f"""
+    QWidget {{
+        background-color: {DarkTheme.BG_SECONDARY};
+        border: 1px solid {DarkTheme.BORDER_PRIMARY};
+        border-radius: 8px;
+    }}
+    QLabel#sectionTitle {{
+        color: {DarkTheme.TEXT_PRIMARY}; font-size: 14px;
+        font-weight: bold; border: none;
+    }}
+    QLabel#fieldLabel {{
+        color: {DarkTheme.TEXT_SECONDARY}; font-size: 12px; border: none;
+    }}
+    QLabel#hint {{
+        color: {DarkTheme.TEXT_SECONDARY}; font-size: 11px; border: none;
+    }}
+    QFrame#separator {{
+        color: {DarkTheme.BORDER_PRIMARY}; border: none;
+        background: {DarkTheme.BORDER_PRIMARY}; max-height: 1px;
+    }}
+""" + _STATUS_RULES_QSS
+
+
+def _filled_btn_qss(bg, hover, pressed):
+    return f"""
+    QPushButton {{
+        background-color: {bg};
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 0 20px;
+        font-size: 13px;
+        font-weight: bold;
+    }}
+    QPushButton:hover {{
+        background-color: {hover};
+    }}
+    QPushButton:pressed {{
+        background-color: {pressed};
+    }}
+"""
+
+
+# Load Model / Start Collection, and the red Stop Collection variant
+_PRIMARY_BTN_QSS = _filled_btn_qss(
+    DarkTheme.PRIMARY, DarkTheme.PRIMARY_HOVER, DarkTheme.PRIMARY_PRESSED)
+_DANGER_BTN_QSS = _filled_btn_qss(
+    DarkTheme.ERROR, DarkTheme.ERROR_HOVER, DarkTheme.ERROR_PRESSED)
+
+# Secondary buttons in the ROI / classifier sections
+_ROI_BTN_QSS = f"""
+    QPushButton {{
+        background-color: {DarkTheme.BG_INPUT};
+        color: {DarkTheme.TEXT_PRIMARY};
+        border: 1px solid {DarkTheme.BORDER_PRIMARY};
+        border-radius: 6px;
+        padding: 0 14px;
+        font-size: 13px;
+    }}
+    QPushButton:hover {{
+        background-color: {DarkTheme.BG_HOVER};
+        border-color: {DarkTheme.BORDER_SECONDARY};
+    }}
+    QPushButton:pressed {{
+        background-color: {DarkTheme.BG_PRESSED};
+    }}
+"""
+
+
+# Static page chrome — formatted once at import, not per HomePage build
+_CONTENT_QSS = f"background-color: {DarkTheme.BG_PRIMARY};"
+_TITLE_QSS = (f"color: {DarkTheme.TEXT_PRIMARY}; font-size: 18px; "
+              f"font-weight: bold; border: none; background: transparent;")
+_HEADER_QSS = f"""
+    QWidget {{
+        background-color: {DarkTheme.BG_SECONDARY};
+        border-bottom: 1px solid {DarkTheme.BORDER_PRIMARY};
+    }}
+""" + _STATUS_RULES_QSS
+
+_SETTINGS_BTN_QSS = f"""
+    QPushButton {{
+        background-color: {DarkTheme.BG_INPUT};
+        color: {DarkTheme.TEXT_PRIMARY};
+        border: none;
+        border-radius: 6px;
+        padding: 0 16px;
+        font-size: 13px;
+    }}
+    QPushButton:hover {{
+        background-color: {DarkTheme.BG_HOVER};
+    }}
+"""
+
+_INFO_BAR_QSS = "background-color: rgba(0, 0, 0, 180); border-radius: 4px;"
+_INFO_KEY_QSS = f"color: {DarkTheme.TEXT_SECONDARY}; font-size: 11px; border: none;"
+_INFO_VALUE_QSS = (f"color: {DarkTheme.TEXT_PRIMARY}; font-size: 11px; "
+                   f"font-weight: bold; border: none;")
+
+_COMBO_QSS = f"""
+    QComboBox {{
+        background-color: {DarkTheme.BG_INPUT};
+        color: {DarkTheme.TEXT_PRIMARY};
+        border: 1px solid {DarkTheme.BORDER_PRIMARY};
+        border-radius: 6px;
+        padding: 0 12px;
+        font-size: 13px;
+    }}
+    QComboBox:hover {{
+        border-color: {DarkTheme.BORDER_SECONDARY};
+    }}
+    QComboBox::drop-down {{
+        border: none;
+        width: 24px;
+    }}
+    QComboBox QAbstractItemView {{
+        background-color: {DarkTheme.BG_INPUT};
+        color: {DarkTheme.TEXT_PRIMARY};
+        selection-background-color: {DarkTheme.PRIMARY};
+        border: 1px solid {DarkTheme.BORDER_PRIMARY};
+    }}
+"""
+
+_SPINBOX_QSS = f"""
+    QSpinBox {{
+        background-color: {DarkTheme.BG_INPUT};
+        color: {DarkTheme.TEXT_PRIMARY};
+        border: 1px solid {DarkTheme.BORDER_PRIMARY};
+        border-radius: 6px;
+        padding: 0 12px;
+        font-size: 13px;
+    }}
+    QSpinBox:hover {{
+        border-color: {DarkTheme.BORDER_SECONDARY};
+    }}
+    QSpinBox::up-button, QSpinBox::down-button {{
+        background-color: {DarkTheme.BG_HOVER};
+        border: none;
+        width: 20px;
+    }}
+"""
+
+_START_INSPECTION_BTN_QSS = f"""
+    QPushButton {{
+        background-color: {DarkTheme.BG_INPUT};
+        color: {DarkTheme.TEXT_DISABLED};
+        border: 1px solid {DarkTheme.BORDER_PRIMARY};
+        border-radius: 8px;
+        padding: 0 24px;
+        font-size: 14px;
+    }}
+    QPushButton:enabled {{
+        background-color: {DarkTheme.SUCCESS};
+        color: white;
+        border: none;
+        font-weight: bold;
+    }}
+    QPushButton:enabled:hover {{
+        background-color: {DarkTheme.SUCCESS_HOVER};
+    }}
+"""
+
+_BROWSE_BTN_QSS = f"""
+    QPushButton {{
+        background-color: {DarkTheme.BG_INPUT};
+        color: {DarkTheme.TEXT_PRIMARY};
+        border: 1px solid {DarkTheme.BORDER_PRIMARY};
+        border-radius: 6px;
+        font-size: 16px;
+    }}
+    QPushButton:hover {{
+        background-color: {DarkTheme.BG_HOVER};
+    }}
+"""
+
+_MODEL_CARD_QSS = f"""
+    QFrame {{
+        background-color: {DarkTheme.BG_CARD};
+        border: 1px solid {DarkTheme.BORDER_PRIMARY};
+        border-radius: 8px;
+        padding: 12px;
+    }}
+"""
+
+_MODEL_ICON_QSS = "font-size: 24px; border: none;"
+_MODEL_PATH_QSS = f"font-size: 12px; color: {DarkTheme.TEXT_SECONDARY}; border: none;"
+
+_LOG_LIST_QSS = f"""
+    QListView {{
+        background-color: {DarkTheme.BG_INPUT};
+        color: {DarkTheme.TEXT_PRIMARY};
+        border: 1px solid {DarkTheme.BORDER_PRIMARY};
+        border-radius: 6px;
+        font-size: 11px;
+        padding: 4px;
+    }}
+    QListView::item {{
+        padding: 3px 6px;
+        border: none;
+    }}
+"""
+
+
+def _set_status(label, status):
+    """Switch a status label to another ``status`` variant and re-polish it."""
+    if label.property("status") != status:
+        label.setProperty("status", status)
+        label.style().unpolish(label)
+        label.style().polish(label)
+
+
+def _set_visible(widget, visible):
+    """``setVisible`` that skips the show/hide machinery when nothing changes."""
+    if widget.isHidden() == visible:
+        widget.setVisible(visible)
+
+
+def _set_text(label, text):
+    """``setText`` that skips the size-hint/relayout work for identical text."""
+    if label.text() != text:
+        label.setText(text)
+
+
+def _set_qss(widget, qss):
+    """Apply *qss* only if it differs from the widget's current stylesheet.
+
+    ``setStyleSheet`` re-parses the QSS and re-polishes the widget even
+    for an identical string, and some of these swaps run every frame.
+    """
+    if widget.styleSheet() != qss:
+        widget.setStyleSheet(qss)
+
+
+# Fixed combo options (index order matters to the handlers)
+_TASK_TYPES = ("Classification", "Detection", "Segmentation")
+_COLLECTION_MODES = ("Save Images", "Record Video")
+
+# Inspection log text colours (ForegroundRole is queried on every repaint)
+_LOG_DEFECT_COLOR = QColor(255, 80, 80)
+_LOG_GOOD_COLOR = QColor(80, 220, 80)
+
+
+class _InspectionLogModel(QAbstractListModel):
+    """List model backing the inspection log view.
+
+    Holds the raw ``(tracker_id, entry)`` pairs and only formats a row when
+    the view asks for it, so off-screen entries cost nothing to render.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._entries = []
+        # "HH:MM:SS" per whole second — many log entries share a second
+        self._time_strs = {}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._entries)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        tid, entry = self._entries[index.row()]
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            ts = entry.get("timestamp", 0)
+            time_str = self._format_time(int(ts)) if ts else "—"
+            label = entry.get("label", "?")
+            score = entry.get("score", 0)
+            return f"#{tid}  ·  {label} {score:.0%}  ·  {time_str}"
+
+        if role == Qt.ItemDataRole.ForegroundRole:
+            # Colour-code: bad keywords → red text, otherwise → green
+            is_defect = is_defect_label(entry.get("label", "?"), entry.get("id", -1))
+            return _LOG_DEFECT_COLOR if is_defect else _LOG_GOOD_COLOR
+
+        return None
+
+    def _format_time(self, sec: int) -> str:
+        time_str = self._time_strs.get(sec)
+        if time_str is None:
+            if len(self._time_strs) > 1024:
+                self._time_strs.clear()
+            time_str = time.strftime("%H:%M:%S", time.localtime(sec))
+            self._time_strs[sec] = time_str
+        return time_str
+
+    def set_log(self, log: dict):
+        """Replace the contents with *log*, newest entry first."""
+        self.beginResetModel()
+        self._entries = sorted(
+            log.items(), key=lambda kv: kv[1].get("timestamp", 0), reverse=True
+        )
+        self.endResetModel()
+
+    def add_new(self, log: dict):
+        """Insert entries of *log* not shown yet at the top of the list.
+
+        The log only ever grows between clears, so the live path inserts
+        just the new rows instead of resetting the whole view.  Falls back
+        to :meth:`set_log` when the new rows would not all land on top.
+        """
+        known = {tid for tid, _ in self._entries}
+        new = sorted(
+            ((tid, entry) for tid, entry in log.items() if tid not in known),
+            key=lambda kv: kv[1].get("timestamp", 0), reverse=True,
+        )
+        if not new:
+            return
+        if (len(known) + len(new) != len(log)
+                or (self._entries and new[-1][1].get("timestamp", 0)
+                    < self._entries[0][1].get("timestamp", 0))):
+            self.set_log(log)
+            return
+
+        self.beginInsertRows(QModelIndex(), 0, len(new) - 1)
+        self._entries[:0] = new
+        self.endInsertRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self._entries = []
+        self._time_strs.clear()
+        self.endResetModel()
 
 
 class HomePage(QWidget):
@@ -18,9 +374,23 @@ class HomePage(QWidget):
     # Signals for navigation
     navigate_to_settings = Signal()
 
+    # queue_stat() key → label attribute written by _flush_stats()
+    _STAT_LABELS = {
+        "resolution": "resolution_value",
+        "fps": "fps_value",
+        "detections": "detection_count_label",
+        "zone": "zone_count_label",
+        "collection": "collection_status_label",
+    }
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.parent_window = parent
+        # Services are resolved once here; handlers and per-frame hooks
+        # test these instead of probing parent_window each call
+        self._inspection = getattr(parent, "inspection_service", None)
+        self._dataset = getattr(parent, "dataset_service", None)
+        self._settings_svc = getattr(parent, "settings_service", None)
 
         # UI element references
         self.video_label = None
@@ -54,43 +424,78 @@ class HomePage(QWidget):
         self.load_classifier_btn = None
         self.classifier_status_label = None
         self.inspection_log_list = None
+        self._log_model = None
         self.clear_log_btn = None
-        self._classifier_section_widgets = []  # widgets to show/hide
+        self._classifier_section_widgets = []  # widgets to show/hide (built lazily)
+        self._classifier_slot = None
+
+        # Live stat labels are written at most once per 100 ms
+        self._stats_dirty: dict[str, str] = {}
+        self._stats_timer = QTimer(self)
+        self._stats_timer.setInterval(100)
+        self._stats_timer.setSingleShot(True)
+        self._stats_timer.timeout.connect(self._flush_stats)
+        # Raw values behind the last queued stat text, per stat key, so
+        # ticks with unchanged counts skip formatting and queueing
+        self._stat_inputs: dict[str, object] = {}
 
         self.init_ui()
 
     def init_ui(self):
-        """Initialize the home page UI."""
-        main_layout = QVBoxLayout(self)
-        main_layout.setContentsMargins(0, 0, 0, 0)
-        main_layout.setSpacing(0)
-
-        content_widget = QWidget()
-        content_widget.setStyleSheet(f"background-color: {DarkTheme.BG_PRIMARY};")
-        content_layout = QVBoxLayout(content_widget)
-        content_layout.setContentsMargins(0, 0, 0, 0)
-        content_layout.setSpacing(0)
-
-        # Header bar
-        header = self._create_header()
-        content_layout.addWidget(header)
+        """Initialize the home page UI.
 
-        # Main content: camera feed + side panel
-        body = self._create_body()
-        content_layout.addWidget(body, stretch=1)
-
-        main_layout.addWidget(content_widget)
+        Repaints are suspended while the widget tree is built so the
+        many ``addWidget`` calls collapse into one layout/paint pass.
+        """
+        self.setUpdatesEnabled(False)
+        try:
+            main_layout = QVBoxLayout(self)
+            main_layout.setContentsMargins(0, 0, 0, 0)
+            main_layout.setSpacing(0)
+
+            content_widget = QWidget()
+            content_widget.setStyleSheet(_CONTENT_QSS)
+            content_layout = QVBoxLayout(content_widget)
+            content_layout.setContentsMargins(0, 0, 0, 0)
+            content_layout.setSpacing(0)
+
+            # Header bar
+            header = self._create_header()
+            content_layout.addWidget(header)
+
+            # Main content: camera feed + side panel
+            body = self._create_body()
+            content_layout.addWidget(body, stretch=1)
+
+            main_layout.addWidget(content_widget)
+
+            self._create_shortcuts()
+            main_layout.activate()
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _create_shortcuts(self):
+        """Bind keyboard shortcuts to the main action buttons.
+
+        Scoped to this page and its children, and routed through
+        ``animateClick`` so disabled buttons ignore them.
+        """
+        bindings = (
+            ("Ctrl+I", self.start_inspection_btn),
+            ("Ctrl+R", self.draw_roi_btn),
+            ("Ctrl+D", self.collection_btn),
+        )
+        for key, button in bindings:
+            shortcut = QShortcut(QKeySequence(key), self)
+            shortcut.setContext(Qt.ShortcutContext.WidgetWithChildrenShortcut)
+            shortcut.activated.connect(button.animateClick)
+            button.setToolTip(f"Shortcut: {key}")
 
     def _create_header(self) -> QWidget:
         """Create the header bar."""
         header = QWidget()
         header.setFixedHeight(60)
-        header.setStyleSheet(f"""
-            QWidget {{
-                background-color: {DarkTheme.BG_SECONDARY};
-                border-bottom: 1px solid {DarkTheme.BORDER_PRIMARY};
-            }}
-        """)
+        header.setStyleSheet(_HEADER_QSS)
 
         layout = QHBoxLayout(header)
         layout.setContentsMargins(24, 0, 24, 0)
@@ -101,16 +506,11 @@ class HomePage(QWidget):
         title_layout.setContentsMargins(0, 0, 0, 0)
 
         title = QLabel("InspektLine")
-        title.setStyleSheet(
-            f"color: {DarkTheme.TEXT_PRIMARY}; font-size: 18px; "
-            f"font-weight: bold; border: none; background: transparent;"
-        )
+        title.setStyleSheet(_TITLE_QSS)
         title_layout.addWidget(title)
 
         self.model_status = QLabel("No model loaded")
-        self.model_status.setStyleSheet(
-            f"color: {DarkTheme.TEXT_SECONDARY}; font-size: 12px; border: none;"
-        )
+        self.model_status.setProperty("status", "muted")
         title_layout.addWidget(self.model_status)
 
         layout.addLayout(title_layout)
@@ -120,19 +520,7 @@ class HomePage(QWidget):
         settings_btn = QPushButton("⚙  Settings")
         settings_btn.setFixedHeight(36)
         settings_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        settings_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {DarkTheme.BG_INPUT};
-                color: {DarkTheme.TEXT_PRIMARY};
-                border: none;
-                border-radius: 6px;
-                padding: 0 16px;
-                font-size: 13px;
-            }}
-            QPushButton:hover {{
-                background-color: {DarkTheme.BG_HOVER};
-            }}
-        """)
+        settings_btn.setStyleSheet(_SETTINGS_BTN_QSS)
         settings_btn.clicked.connect(self.navigate_to_settings.emit)
         layout.addWidget(settings_btn)
 
@@ -157,14 +545,7 @@ class HomePage(QWidget):
 
     def _create_camera_area(self) -> QWidget:
         """Create the camera feed display area."""
-        container = QWidget()
-        container.setStyleSheet(f"""
-            QWidget {{
-                background-color: {DarkTheme.BG_SECONDARY};
-                border: 1px solid {DarkTheme.BORDER_PRIMARY};
-                border-radius: 8px;
-            }}
-        """)
+        container = VideoContainer()
         layout = QVBoxLayout(container)
         layout.setContentsMargins(4, 4, 4, 4)
         layout.setSpacing(4)
@@ -175,40 +556,34 @@ class HomePage(QWidget):
         self.video_label.setSizePolicy(
             QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding
         )
+        # Connected once; the label only emits while in draw mode
+        self.video_label.roi_polygon_drawn.connect(self._on_roi_polygon_drawn)
         layout.addWidget(self.video_label, stretch=1)
 
         # Info bar below video
         info_bar = QWidget()
         info_bar.setMaximumHeight(32)
-        info_bar.setStyleSheet(
-            "background-color: rgba(0, 0, 0, 180); border-radius: 4px;"
-        )
+        info_bar.setStyleSheet(_INFO_BAR_QSS)
         info_layout = QHBoxLayout(info_bar)
         info_layout.setContentsMargins(12, 4, 12, 4)
         info_layout.setSpacing(16)
 
         res_label = QLabel("Resolution:")
-        res_label.setStyleSheet(f"color: {DarkTheme.TEXT_SECONDARY}; font-size: 11px; border: none;")
+        res_label.setStyleSheet(_INFO_KEY_QSS)
         info_layout.addWidget(res_label)
 
         self.resolution_value = QLabel("—")
-        self.resolution_value.setStyleSheet(
-            f"color: {DarkTheme.TEXT_PRIMARY}; font-size: 11px; font-weight: bold; border: none;"
-        )
+        self.resolution_value.setStyleSheet(_INFO_VALUE_QSS)
         info_layout.addWidget(self.resolution_value)
 
         info_layout.addStretch()
 
         fps_icon = QLabel("FPS:")
-        fps_icon.setStyleSheet(
-            f"color: {DarkTheme.TEXT_SECONDARY}; font-size: 11px; border: none;"
-        )
+        fps_icon.setStyleSheet(_INFO_KEY_QSS)
         info_layout.addWidget(fps_icon)
 
         self.fps_value = QLabel("—")
-        self.fps_value.setStyleSheet(
-            f"color: {DarkTheme.TEXT_PRIMARY}; font-size: 11px; font-weight: bold; border: none;"
-        )
+        self.fps_value.setStyleSheet(_INFO_VALUE_QSS)
         info_layout.addWidget(self.fps_value)
 
         layout.addWidget(info_bar)
@@ -220,78 +595,40 @@ class HomePage(QWidget):
         panel = QWidget()
         panel.setMinimumWidth(280)
         panel.setMaximumWidth(360)
-        panel.setStyleSheet(f"""
-            QWidget {{
-                background-color: {DarkTheme.BG_SECONDARY};
-                border: 1px solid {DarkTheme.BORDER_PRIMARY};
-                border-radius: 8px;
-            }}
-        """)
+        panel.setStyleSheet(_SIDE_PANEL_QSS)
 
         layout = QVBoxLayout(panel)
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(16)
 
         # --- Model section ---
-        model_section_title = QLabel("Model")
-        model_section_title.setStyleSheet(
-            f"color: {DarkTheme.TEXT_PRIMARY}; font-size: 14px; "
-            f"font-weight: bold; border: none;"
-        )
+        model_section_title = self._section_title("Model")
         layout.addWidget(model_section_title)
 
-        # Shared combo style
-        combo_style = f"""
-            QComboBox {{
-                background-color: {DarkTheme.BG_INPUT};
-                color: {DarkTheme.TEXT_PRIMARY};
-                border: 1px solid {DarkTheme.BORDER_PRIMARY};
-                border-radius: 6px;
-                padding: 0 12px;
-                font-size: 13px;
-            }}
-            QComboBox:hover {{
-                border-color: {DarkTheme.BORDER_SECONDARY};
-            }}
-            QComboBox::drop-down {{
-                border: none;
-                width: 24px;
-            }}
-            QComboBox QAbstractItemView {{
-                background-color: {DarkTheme.BG_INPUT};
-                color: {DarkTheme.TEXT_PRIMARY};
-                selection-background-color: {DarkTheme.PRIMARY};
-                border: 1px solid {DarkTheme.BORDER_PRIMARY};
-            }}
-        """
 
         # Task type selector
         type_label = QLabel("Task")
-        type_label.setStyleSheet(
-            f"color: {DarkTheme.TEXT_SECONDARY}; font-size: 12px; border: none;"
-        )
+        type_label.setObjectName("fieldLabel")
         layout.addWidget(type_label)
 
         self.task_type_combo = QComboBox()
-        self.task_type_combo.addItems(["Classification", "Detection", "Segmentation"])
+        self.task_type_combo.addItems(_TASK_TYPES)
         self.task_type_combo.setFixedHeight(36)
         self.task_type_combo.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.task_type_combo.setStyleSheet(combo_style)
+        self.task_type_combo.setStyleSheet(_COMBO_QSS)
         self.task_type_combo.currentIndexChanged.connect(self._on_task_type_changed)
         layout.addWidget(self.task_type_combo)
 
         # Model variant selector (visible for detection / segmentation)
         self.model_variant_label = QLabel("Model")
-        self.model_variant_label.setStyleSheet(
-            f"color: {DarkTheme.TEXT_SECONDARY}; font-size: 12px; border: none;"
-        )
+        self.model_variant_label.setObjectName("fieldLabel")
         self.model_variant_label.setVisible(False)
         layout.addWidget(self.model_variant_label)
 
         self.model_variant_combo = QComboBox()
         self.model_variant_combo.setFixedHeight(36)
         self.model_variant_combo.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.model_variant_combo.setStyleSheet(combo_style)
+        self.model_variant_combo.setStyleSheet(_COMBO_QSS)
         self.model_variant_combo.setVisible(False)
         layout.addWidget(self.model_variant_combo)
 
@@ -303,45 +640,21 @@ class HomePage(QWidget):
         self.load_model_btn = QPushButton("📂  Load Model")
         self.load_model_btn.setFixedHeight(44)
         self.load_model_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.load_model_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {DarkTheme.PRIMARY};
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 0 20px;
-                font-size: 13px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: {DarkTheme.PRIMARY_HOVER};
-            }}
-            QPushButton:pressed {{
-                background-color: {DarkTheme.PRIMARY_PRESSED};
-            }}
-        """)
+        self.load_model_btn.setStyleSheet(_PRIMARY_BTN_QSS)
         self.load_model_btn.clicked.connect(self._load_model)
         layout.addWidget(self.load_model_btn)
 
         # Separator
-        sep = QFrame()
-        sep.setFrameShape(QFrame.Shape.HLine)
-        sep.setStyleSheet(f"color: {DarkTheme.BORDER_PRIMARY}; border: none; background: {DarkTheme.BORDER_PRIMARY}; max-height: 1px;")
+        sep = self._separator()
         layout.addWidget(sep)
 
         # --- Inspection section ---
-        inspection_title = QLabel("Inspection")
-        inspection_title.setStyleSheet(
-            f"color: {DarkTheme.TEXT_PRIMARY}; font-size: 14px; "
-            f"font-weight: bold; border: none;"
-        )
+        inspection_title = self._section_title("Inspection")
         layout.addWidget(inspection_title)
 
         # Inspection status label
         self.inspection_label = QLabel("Load a model to begin inspection")
-        self.inspection_label.setStyleSheet(
-            f"color: {DarkTheme.TEXT_SECONDARY}; font-size: 12px; border: none;"
-        )
+        self.inspection_label.setProperty("status", "muted")
         self.inspection_label.setWordWrap(True)
         layout.addWidget(self.inspection_label)
 
@@ -350,69 +663,28 @@ class HomePage(QWidget):
         self.start_inspection_btn.setFixedHeight(50)
         self.start_inspection_btn.setEnabled(False)
         self.start_inspection_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.start_inspection_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {DarkTheme.BG_INPUT};
-                color: {DarkTheme.TEXT_DISABLED};
-                border: 1px solid {DarkTheme.BORDER_PRIMARY};
-                border-radius: 8px;
-                padding: 0 24px;
-                font-size: 14px;
-            }}
-            QPushButton:enabled {{
-                background-color: {DarkTheme.SUCCESS};
-                color: white;
-                border: none;
-                font-weight: bold;
-            }}
-            QPushButton:enabled:hover {{
-                background-color: {DarkTheme.SUCCESS_HOVER};
-            }}
-        """)
+        self.start_inspection_btn.setStyleSheet(_START_INSPECTION_BTN_QSS)
         self.start_inspection_btn.clicked.connect(self._toggle_inspection)
         layout.addWidget(self.start_inspection_btn)
 
         # Detection count (visible during RF-DETR inspection)
         self.detection_count_label = QLabel("")
-        self.detection_count_label.setStyleSheet(
-            f"color: {DarkTheme.TEXT_SECONDARY}; font-size: 12px; border: none;"
-        )
+        self.detection_count_label.setObjectName("fieldLabel")
+        # Keep its slot in the layout while hidden so toggling visibility
+        # on start/stop does not re-layout the whole side panel
+        policy = self.detection_count_label.sizePolicy()
+        policy.setRetainSizeWhenHidden(True)
+        self.detection_count_label.setSizePolicy(policy)
         self.detection_count_label.setVisible(False)
         layout.addWidget(self.detection_count_label)
 
         # --- ROI Tracking section ---
-        roi_sep = QFrame()
-        roi_sep.setFrameShape(QFrame.Shape.HLine)
-        roi_sep.setStyleSheet(
-            f"color: {DarkTheme.BORDER_PRIMARY}; border: none; "
-            f"background: {DarkTheme.BORDER_PRIMARY}; max-height: 1px;"
-        )
+        roi_sep = self._separator()
         layout.addWidget(roi_sep)
 
-        roi_title = QLabel("ROI Zone Counting")
-        roi_title.setStyleSheet(
-            f"color: {DarkTheme.TEXT_PRIMARY}; font-size: 14px; "
-            f"font-weight: bold; border: none;"
-        )
+        roi_title = self._section_title("ROI Zone Counting")
         layout.addWidget(roi_title)
 
-        roi_btn_style = f"""
-            QPushButton {{
-                background-color: {DarkTheme.BG_INPUT};
-                color: {DarkTheme.TEXT_PRIMARY};
-                border: 1px solid {DarkTheme.BORDER_PRIMARY};
-                border-radius: 6px;
-                padding: 0 14px;
-                font-size: 13px;
-            }}
-            QPushButton:hover {{
-                background-color: {DarkTheme.BG_HOVER};
-                border-color: {DarkTheme.BORDER_SECONDARY};
-            }}
-            QPushButton:pressed {{
-                background-color: {DarkTheme.BG_PRESSED};
-            }}
-        """
 
         roi_buttons_row = QHBoxLayout()
         roi_buttons_row.setSpacing(8)
@@ -420,14 +692,14 @@ class HomePage(QWidget):
         self.draw_roi_btn = QPushButton("✏  Draw ROI")
         self.draw_roi_btn.setFixedHeight(36)
         self.draw_roi_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.draw_roi_btn.setStyleSheet(roi_btn_style)
+        self.draw_roi_btn.setStyleSheet(_ROI_BTN_QSS)
         self.draw_roi_btn.clicked.connect(self._toggle_draw_roi)
         roi_buttons_row.addWidget(self.draw_roi_btn)
 
         self.clear_roi_btn = QPushButton("✖  Clear")
         self.clear_roi_btn.setFixedHeight(36)
         self.clear_roi_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.clear_roi_btn.setStyleSheet(roi_btn_style)
+        self.clear_roi_btn.setStyleSheet(_ROI_BTN_QSS)
         self.clear_roi_btn.setEnabled(False)
         self.clear_roi_btn.clicked.connect(self._clear_roi)
         roi_buttons_row.addWidget(self.clear_roi_btn)
@@ -437,158 +709,48 @@ class HomePage(QWidget):
         self.reset_count_btn = QPushButton("↺  Reset Count")
         self.reset_count_btn.setFixedHeight(36)
         self.reset_count_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.reset_count_btn.setStyleSheet(roi_btn_style)
+        self.reset_count_btn.setStyleSheet(_ROI_BTN_QSS)
         self.reset_count_btn.setEnabled(False)
         self.reset_count_btn.clicked.connect(self._reset_roi_counts)
         layout.addWidget(self.reset_count_btn)
 
         self.zone_count_label = QLabel("Draw a polygon on the video to start counting")
         self.zone_count_label.setWordWrap(True)
-        self.zone_count_label.setStyleSheet(
-            f"color: {DarkTheme.TEXT_SECONDARY}; font-size: 12px; border: none;"
-        )
+        self.zone_count_label.setProperty("status", "muted")
         layout.addWidget(self.zone_count_label)
 
         # --- Two-stage Classifier sub-section (inside ROI) ---
-        classifier_sep = QFrame()
-        classifier_sep.setFrameShape(QFrame.Shape.HLine)
-        classifier_sep.setStyleSheet(
-            f"color: {DarkTheme.BORDER_PRIMARY}; border: none; "
-            f"background: {DarkTheme.BORDER_PRIMARY}; max-height: 1px;"
-        )
-        layout.addWidget(classifier_sep)
-
-        classifier_title = QLabel("ROI Inspection")
-        classifier_title.setStyleSheet(
-            f"color: {DarkTheme.TEXT_PRIMARY}; font-size: 14px; "
-            f"font-weight: bold; border: none;"
-        )
-        layout.addWidget(classifier_title)
-
-        classifier_desc = QLabel(
-            "Load a ConvNeXt classifier to inspect objects entering the ROI zone."
-        )
-        classifier_desc.setWordWrap(True)
-        classifier_desc.setStyleSheet(
-            f"color: {DarkTheme.TEXT_SECONDARY}; font-size: 11px; border: none;"
-        )
-        layout.addWidget(classifier_desc)
-
-        self.load_classifier_btn = QPushButton("📂  Load Classifier")
-        self.load_classifier_btn.setFixedHeight(40)
-        self.load_classifier_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.load_classifier_btn.setStyleSheet(roi_btn_style)
-        self.load_classifier_btn.clicked.connect(self._load_classifier)
-        layout.addWidget(self.load_classifier_btn)
-
-        self.classifier_status_label = QLabel("No classifier loaded")
-        self.classifier_status_label.setWordWrap(True)
-        self.classifier_status_label.setStyleSheet(
-            f"color: {DarkTheme.TEXT_SECONDARY}; font-size: 11px; border: none;"
-        )
-        layout.addWidget(self.classifier_status_label)
-
-        # Inspection log list
-        log_label = QLabel("Inspection Log")
-        log_label.setStyleSheet(
-            f"color: {DarkTheme.TEXT_SECONDARY}; font-size: 12px; border: none;"
-        )
-        layout.addWidget(log_label)
-
-        self.inspection_log_list = QListWidget()
-        self.inspection_log_list.setMaximumHeight(150)
-        self.inspection_log_list.setSelectionMode(
-            QAbstractItemView.SelectionMode.NoSelection
-        )
-        self.inspection_log_list.setStyleSheet(f"""
-            QListWidget {{
-                background-color: {DarkTheme.BG_INPUT};
-                color: {DarkTheme.TEXT_PRIMARY};
-                border: 1px solid {DarkTheme.BORDER_PRIMARY};
-                border-radius: 6px;
-                font-size: 11px;
-                padding: 4px;
-            }}
-            QListWidget::item {{
-                padding: 3px 6px;
-                border: none;
-            }}
-        """)
-        layout.addWidget(self.inspection_log_list)
-
-        self.clear_log_btn = QPushButton("↺  Clear Log")
-        self.clear_log_btn.setFixedHeight(32)
-        self.clear_log_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.clear_log_btn.setStyleSheet(roi_btn_style)
-        self.clear_log_btn.clicked.connect(self._clear_classification_log)
-        layout.addWidget(self.clear_log_btn)
-
-        # Collect all two-stage classifier widgets for show/hide
-        self._classifier_section_widgets = [
-            classifier_sep, classifier_title, classifier_desc,
-            self.load_classifier_btn, self.classifier_status_label,
-            log_label, self.inspection_log_list, self.clear_log_btn,
-        ]
-        # Initially hidden — shown when task is detection/segmentation
-        for w in self._classifier_section_widgets:
-            w.setVisible(False)
+        # Built on first use by _ensure_classifier_section(); most sessions
+        # never switch to detection/segmentation.
+        self._classifier_slot = QVBoxLayout()
+        self._classifier_slot.setContentsMargins(0, 0, 0, 0)
+        self._classifier_slot.setSpacing(layout.spacing())
+        layout.addLayout(self._classifier_slot)
 
         # Separator
-        sep2 = QFrame()
-        sep2.setFrameShape(QFrame.Shape.HLine)
-        sep2.setStyleSheet(f"color: {DarkTheme.BORDER_PRIMARY}; border: none; background: {DarkTheme.BORDER_PRIMARY}; max-height: 1px;")
+        sep2 = self._separator()
         layout.addWidget(sep2)
 
         # --- Dataset Collection section ---
-        dataset_title = QLabel("Dataset Collection")
-        dataset_title.setStyleSheet(
-            f"color: {DarkTheme.TEXT_PRIMARY}; font-size: 14px; "
-            f"font-weight: bold; border: none;"
-        )
+        dataset_title = self._section_title("Dataset Collection")
         layout.addWidget(dataset_title)
 
         # Mode selector
         mode_label = QLabel("Mode")
-        mode_label.setStyleSheet(
-            f"color: {DarkTheme.TEXT_SECONDARY}; font-size: 12px; border: none;"
-        )
+        mode_label.setObjectName("fieldLabel")
         layout.addWidget(mode_label)
 
         self.collection_mode_combo = QComboBox()
-        self.collection_mode_combo.addItems(["Save Images", "Record Video"])
+        self.collection_mode_combo.addItems(_COLLECTION_MODES)
         self.collection_mode_combo.setFixedHeight(36)
         self.collection_mode_combo.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.collection_mode_combo.setStyleSheet(f"""
-            QComboBox {{
-                background-color: {DarkTheme.BG_INPUT};
-                color: {DarkTheme.TEXT_PRIMARY};
-                border: 1px solid {DarkTheme.BORDER_PRIMARY};
-                border-radius: 6px;
-                padding: 0 12px;
-                font-size: 13px;
-            }}
-            QComboBox:hover {{
-                border-color: {DarkTheme.BORDER_SECONDARY};
-            }}
-            QComboBox::drop-down {{
-                border: none;
-                width: 24px;
-            }}
-            QComboBox QAbstractItemView {{
-                background-color: {DarkTheme.BG_INPUT};
-                color: {DarkTheme.TEXT_PRIMARY};
-                selection-background-color: {DarkTheme.PRIMARY};
-                border: 1px solid {DarkTheme.BORDER_PRIMARY};
-            }}
-        """)
+        self.collection_mode_combo.setStyleSheet(_COMBO_QSS)
         self.collection_mode_combo.currentIndexChanged.connect(self._on_mode_changed)
         layout.addWidget(self.collection_mode_combo)
 
         # Frame skip (only visible in image mode)
         self.frame_skip_label = QLabel("Save every N frames")
-        self.frame_skip_label.setStyleSheet(
-            f"color: {DarkTheme.TEXT_SECONDARY}; font-size: 12px; border: none;"
-        )
+        self.frame_skip_label.setObjectName("fieldLabel")
         layout.addWidget(self.frame_skip_label)
 
         self.frame_skip_spin = QSpinBox()
@@ -596,24 +758,7 @@ class HomePage(QWidget):
         self.frame_skip_spin.setMaximum(1000)
         self.frame_skip_spin.setValue(5)
         self.frame_skip_spin.setFixedHeight(36)
-        self.frame_skip_spin.setStyleSheet(f"""
-            QSpinBox {{
-                background-color: {DarkTheme.BG_INPUT};
-                color: {DarkTheme.TEXT_PRIMARY};
-                border: 1px solid {DarkTheme.BORDER_PRIMARY};
-                border-radius: 6px;
-                padding: 0 12px;
-                font-size: 13px;
-            }}
-            QSpinBox:hover {{
-                border-color: {DarkTheme.BORDER_SECONDARY};
-            }}
-            QSpinBox::up-button, QSpinBox::down-button {{
-                background-color: {DarkTheme.BG_HOVER};
-                border: none;
-                width: 20px;
-            }}
-        """)
+        self.frame_skip_spin.setStyleSheet(_SPINBOX_QSS)
         layout.addWidget(self.frame_skip_spin)
 
         # Output directory picker
@@ -621,9 +766,7 @@ class HomePage(QWidget):
         output_dir_row.setSpacing(8)
 
         self.output_dir_label = QLabel("storage/dataset")
-        self.output_dir_label.setStyleSheet(
-            f"color: {DarkTheme.TEXT_SECONDARY}; font-size: 11px; border: none;"
-        )
+        self.output_dir_label.setObjectName("hint")
         self.output_dir_label.setWordWrap(True)
         output_dir_row.addWidget(self.output_dir_label, stretch=1)
 
@@ -631,18 +774,7 @@ class HomePage(QWidget):
         browse_btn.setFixedSize(36, 36)
         browse_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         browse_btn.setToolTip("Choose output folder")
-        browse_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {DarkTheme.BG_INPUT};
-                color: {DarkTheme.TEXT_PRIMARY};
-                border: 1px solid {DarkTheme.BORDER_PRIMARY};
-                border-radius: 6px;
-                font-size: 16px;
-            }}
-            QPushButton:hover {{
-                background-color: {DarkTheme.BG_HOVER};
-            }}
-        """)
+        browse_btn.setStyleSheet(_BROWSE_BTN_QSS)
         browse_btn.clicked.connect(self._browse_output_dir)
         output_dir_row.addWidget(browse_btn)
 
@@ -650,32 +782,14 @@ class HomePage(QWidget):
 
         # Collection status
         self.collection_status_label = QLabel("Ready")
-        self.collection_status_label.setStyleSheet(
-            f"color: {DarkTheme.TEXT_SECONDARY}; font-size: 12px; border: none;"
-        )
+        self.collection_status_label.setProperty("status", "muted")
         layout.addWidget(self.collection_status_label)
 
         # Start / Stop Collection button
         self.collection_btn = QPushButton("⏺  Start Collection")
         self.collection_btn.setFixedHeight(44)
         self.collection_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.collection_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {DarkTheme.PRIMARY};
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 0 20px;
-                font-size: 13px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: {DarkTheme.PRIMARY_HOVER};
-            }}
-            QPushButton:pressed {{
-                background-color: {DarkTheme.PRIMARY_PRESSED};
-            }}
-        """)
+        self.collection_btn.setStyleSheet(_PRIMARY_BTN_QSS)
         self.collection_btn.clicked.connect(self._toggle_collection)
         layout.addWidget(self.collection_btn)
 
@@ -684,17 +798,21 @@ class HomePage(QWidget):
 
         return panel
 
+    def _section_title(self, text: str) -> QLabel:
+        lbl = QLabel(text)
+        lbl.setObjectName("sectionTitle")
+        return lbl
+
+    def _separator(self) -> QFrame:
+        sep = QFrame()
+        sep.setObjectName("separator")
+        sep.setFrameShape(QFrame.Shape.HLine)
+        return sep
+
     def _create_model_card(self) -> QFrame:
         """Create a card showing current model status."""
         card = QFrame()
-        card.setStyleSheet(f"""
-            QFrame {{
-                background-color: {DarkTheme.BG_CARD};
-                border: 1px solid {DarkTheme.BORDER_PRIMARY};
-                border-radius: 8px;
-                padding: 12px;
-            }}
-        """)
+        card.setStyleSheet(_MODEL_CARD_QSS)
 
         card_layout = QHBoxLayout(card)
         card_layout.setSpacing(10)
@@ -702,14 +820,12 @@ class HomePage(QWidget):
 
         # Brain icon
         icon_label = QLabel("🧠")
-        icon_label.setStyleSheet("font-size: 24px; border: none;")
+        icon_label.setStyleSheet(_MODEL_ICON_QSS)
         card_layout.addWidget(icon_label)
 
         # Model path label
         self.model_path_label = QLabel("No model loaded")
-        self.model_path_label.setStyleSheet(
-            f"font-size: 12px; color: {DarkTheme.TEXT_SECONDARY}; border: none;"
-        )
+        self.model_path_label.setStyleSheet(_MODEL_PATH_QSS)
         self.model_path_label.setWordWrap(True)
         card_layout.addWidget(self.model_path_label, stretch=1)
 
@@ -740,9 +856,9 @@ class HomePage(QWidget):
         if not model_path:
             return
 
-        if self.parent_window and hasattr(self.parent_window, "inspection_service"):
+        if self._inspection is not None:
             # Store task + variant in settings before loading
-            settings_svc = getattr(self.parent_window, "settings_service", None)
+            settings_svc = self._settings_svc
             if settings_svc:
                 settings_svc.detection.task_type = task_type
                 if task_type != "classification":
@@ -750,40 +866,135 @@ class HomePage(QWidget):
                         self.model_variant_combo.currentData()
                     )
 
-            success = self.parent_window.inspection_service.load_model(model_path)
-            if success:
-                short_name = model_path.replace("\\", "/").split("/")[-1]
-                if task_type == "classification":
-                    tag = "Classifier"
-                else:
-                    tag = self.model_variant_combo.currentData()
-                self.model_path_label.setText(model_path)
-                self.model_status.setText(f"{tag}: {short_name}")
-                self.model_status.setStyleSheet(
-                    f"color: {DarkTheme.SUCCESS}; font-size: 12px; border: none;"
-                )
-                self.inspection_label.setText("Model loaded — ready to inspect")
-                self.inspection_label.setStyleSheet(
-                    f"color: {DarkTheme.SUCCESS}; font-size: 12px; border: none;"
-                )
-                self.start_inspection_btn.setEnabled(True)
+            # Loading can take seconds (torch / checkpoint I/O) — keep the
+            # UI responsive by running it on the thread pool.  The detector
+            # is swapped from that thread, so inspection must not run (or
+            # be started) until the load finishes.
+            if self._inspection.is_running:
+                self._toggle_inspection()
+            self._set_model_controls_enabled(False)
+            self.model_status.setText("Loading model…")
+            if task_type == "classification":
+                tag = "Classifier"
             else:
-                self.model_path_label.setText("Failed to load model")
-                self.model_path_label.setStyleSheet(
-                    f"font-size: 12px; color: {DarkTheme.ERROR}; border: none;"
-                )
+                tag = self.model_variant_combo.currentData()
+            run_in_background(
+                self._inspection.load_model, model_path,
+                on_done=partial(self._on_model_loaded, model_path, tag),
+            )
+
+    def _on_model_loaded(self, model_path: str, tag: str, success):
+        """Update the model card once the background load finishes."""
+        self._set_model_controls_enabled(True)
+        if success:
+            short_name = model_path.replace("\\", "/").split("/")[-1]
+            self.model_path_label.setText(model_path)
+            self.model_status.setText(f"{tag}: {short_name}")
+            _set_status(self.model_status, "ok")
+            self.inspection_label.setText("Model loaded — ready to inspect")
+            _set_status(self.inspection_label, "ok")
+        else:
+            self.model_status.setText("No model loaded")
+            self.model_path_label.setText("Failed to load model")
+            _set_qss(self.model_path_label, _STATUS_ERROR_QSS)
+
+    def _set_model_controls_enabled(self, enabled: bool):
+        """Lock the model / inspection controls while a model is loading."""
+        self.load_model_btn.setEnabled(enabled)
+        self.task_type_combo.setEnabled(enabled)
+        self.model_variant_combo.setEnabled(enabled)
+        # A failed load leaves no detector, so there is nothing to start
+        self.start_inspection_btn.setEnabled(enabled and self._inspection.has_model)
+
+    def _ensure_classifier_section(self):
+        """Build the two-stage classifier widgets into their slot once."""
+        if self._classifier_section_widgets:
+            return
+        layout = self._classifier_slot
+
+        classifier_sep = self._separator()
+        layout.addWidget(classifier_sep)
+
+        classifier_title = self._section_title("ROI Inspection")
+        layout.addWidget(classifier_title)
+
+        classifier_desc = QLabel(
+            "Load a ConvNeXt classifier to inspect objects entering the ROI zone."
+        )
+        classifier_desc.setWordWrap(True)
+        classifier_desc.setObjectName("hint")
+        layout.addWidget(classifier_desc)
+
+        self.load_classifier_btn = QPushButton("📂  Load Classifier")
+        self.load_classifier_btn.setFixedHeight(40)
+        self.load_classifier_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.load_classifier_btn.setStyleSheet(_ROI_BTN_QSS)
+        self.load_classifier_btn.clicked.connect(self._load_classifier)
+        layout.addWidget(self.load_classifier_btn)
+
+        self.classifier_status_label = QLabel("No classifier loaded")
+        self.classifier_status_label.setWordWrap(True)
+        self.classifier_status_label.setObjectName("smallStatus")
+        self.classifier_status_label.setProperty("status", "muted")
+        layout.addWidget(self.classifier_status_label)
+
+        # Inspection log list
+        log_label = QLabel("Inspection Log")
+        log_label.setObjectName("fieldLabel")
+        layout.addWidget(log_label)
+
+        self._log_model = _InspectionLogModel(self)
+        self.inspection_log_list = QListView()
+        self.inspection_log_list.setModel(self._log_model)
+        # All rows are one line of the same font, so the view can size
+        # rows from the first one instead of measuring each entry
+        self.inspection_log_list.setUniformItemSizes(True)
+        self.inspection_log_list.setMaximumHeight(150)
+        self.inspection_log_list.setSelectionMode(
+            QAbstractItemView.SelectionMode.NoSelection
+        )
+        self.inspection_log_list.setStyleSheet(_LOG_LIST_QSS)
+        layout.addWidget(self.inspection_log_list)
+
+        self.clear_log_btn = QPushButton("↺  Clear Log")
+        self.clear_log_btn.setFixedHeight(32)
+        self.clear_log_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.clear_log_btn.setStyleSheet(_ROI_BTN_QSS)
+        self.clear_log_btn.clicked.connect(self._clear_classification_log)
+        layout.addWidget(self.clear_log_btn)
+
+        # Collect all two-stage classifier widgets for show/hide
+        self._classifier_section_widgets = [
+            classifier_sep, classifier_title, classifier_desc,
+            self.load_classifier_btn, self.classifier_status_label,
+            log_label, self.inspection_log_list, self.clear_log_btn,
+        ]
 
     def _on_task_type_changed(self, index: int):
-        """Populate model variant combo based on the selected task type."""
+        """Populate model variant combo based on the selected task type.
+
+        Toggles up to a dozen widgets and refills the variant combo; the
+        page repaints once at the end instead of after each change.
+        """
+        self.setUpdatesEnabled(False)
+        try:
+            self._apply_task_type(index)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _apply_task_type(self, index: int):
+        """Body of :meth:`_on_task_type_changed` (runs with updates off)."""
         # 0 = Classification, 1 = Detection, 2 = Segmentation
         show_variant = index > 0
-        self.model_variant_label.setVisible(show_variant)
-        self.model_variant_combo.setVisible(show_variant)
+        _set_visible(self.model_variant_label, show_variant)
+        _set_visible(self.model_variant_combo, show_variant)
 
         # Show/hide two-stage classifier section
         show_classifier = index > 0  # Detection or Segmentation
+        if show_classifier:
+            self._ensure_classifier_section()
         for w in self._classifier_section_widgets:
-            w.setVisible(show_classifier)
+            _set_visible(w, show_classifier)
 
         if not show_variant:
             return
@@ -806,36 +1017,67 @@ class HomePage(QWidget):
 
         self.model_variant_combo.blockSignals(False)
 
+    # ================================================================
+    # Live stats (coalesced label updates)
+    # ================================================================
+
+    def queue_stat(self, key: str, text: str):
+        """Queue *text* for the stat label *key*; written on the next flush."""
+        self._stats_dirty[key] = text
+        if not self._stats_timer.isActive():
+            self._stats_timer.start()
+
+    def _drop_stat(self, key: str):
+        """Discard a queued stat so it cannot overwrite an action-time text."""
+        self._stats_dirty.pop(key, None)
+        self._stat_inputs.pop(key, None)  # next update rewrites the label
+
+    def _stat_unchanged(self, key: str, value) -> bool:
+        """Record *value* for stat *key*; True if it equals the last one."""
+        if key in self._stat_inputs and self._stat_inputs[key] == value:
+            return True
+        self._stat_inputs[key] = value
+        return False
+
+    def _flush_stats(self):
+        """Write all queued stat texts to their labels in one pass."""
+        dirty, self._stats_dirty = self._stats_dirty, {}
+        for key, text in dirty.items():
+            label = getattr(self, self._STAT_LABELS[key], None)
+            if label is None or label.text() == text:
+                continue  # e.g. FPS rounds to the same value — no relayout
+            label.blockSignals(True)
+            label.setText(text)
+            label.blockSignals(False)
+
     def update_detection_count(self, count: int):
         """Called from MainWindow to update the live detection counter."""
-        if self.detection_count_label is not None:
-            self.detection_count_label.setVisible(True)
-            self.detection_count_label.setText(f"Detections: {count}")
+        if self.detection_count_label is None or self._stat_unchanged("detections", count):
+            return
+        _set_visible(self.detection_count_label, True)
+        self.queue_stat("detections", f"Detections: {count}")
 
     def _toggle_inspection(self):
         """Start or stop real-time inspection."""
-        if not self.parent_window or not hasattr(self.parent_window, "inspection_service"):
+        svc = self._inspection
+        if svc is None:
             return
-
-        svc = self.parent_window.inspection_service
         if svc.is_running:
             svc.stop()
             self.start_inspection_btn.setText("▶  Start Inspection")
             self.inspection_label.setText("Inspection stopped")
-            self.inspection_label.setStyleSheet(
-                f"color: {DarkTheme.TEXT_SECONDARY}; font-size: 12px; border: none;"
-            )
-            self.detection_count_label.setVisible(False)
+            _set_status(self.inspection_label, "muted")
+            _set_visible(self.detection_count_label, False)
+            self._stat_inputs.pop("detections", None)
         else:
             svc.start()
             self.start_inspection_btn.setText("⏹  Stop Inspection")
             self.inspection_label.setText("Inspection running…")
-            self.inspection_label.setStyleSheet(
-                f"color: {DarkTheme.SUCCESS}; font-size: 12px; border: none;"
-            )
+            _set_status(self.inspection_label, "ok")
             if svc.task_type in ("detection", "segmentation"):
-                self.detection_count_label.setVisible(True)
-                self.detection_count_label.setText("Detections: 0")
+                _set_visible(self.detection_count_label, True)
+                _set_text(self.detection_count_label, "Detections: 0")
+                self._stat_inputs["detections"] = 0
 
     # ================================================================
     # ROI Zone Counting
@@ -854,67 +1096,57 @@ class HomePage(QWidget):
             # Enter drawing mode
             self.video_label.draw_roi_mode = True
             self.draw_roi_btn.setText("✖  Cancel Drawing")
+            self._drop_stat("zone")
             self.zone_count_label.setText(
                 "Left-click to add vertices. Right-click or double-click to close."
             )
-            self.zone_count_label.setStyleSheet(
-                f"color: {DarkTheme.WARNING}; font-size: 12px; border: none;"
-            )
-
-            # Connect signal if not yet connected
-            try:
-                self.video_label.roi_polygon_drawn.disconnect(self._on_roi_polygon_drawn)
-            except RuntimeError:
-                pass
-            self.video_label.roi_polygon_drawn.connect(self._on_roi_polygon_drawn)
+            _set_status(self.zone_count_label, "warn")
 
     def _on_roi_polygon_drawn(self, points):
         """Handle the polygon drawn by the user on the video label."""
-        if not self.parent_window or not hasattr(self.parent_window, "inspection_service"):
+        svc = self._inspection
+        if svc is None:
             return
-
-        svc = self.parent_window.inspection_service
         svc.set_roi_polygon(points)
 
         self.draw_roi_btn.setText("✏  Draw ROI")
         self.clear_roi_btn.setEnabled(True)
         self.reset_count_btn.setEnabled(True)
         n = len(points)
+        self._drop_stat("zone")
         self.zone_count_label.setText(f"ROI set ({n} vertices) — In zone: 0  |  Total: 0")
-        self.zone_count_label.setStyleSheet(
-            f"color: {DarkTheme.SUCCESS}; font-size: 12px; border: none;"
-        )
+        _set_status(self.zone_count_label, "ok")
 
     def _clear_roi(self):
         """Remove the ROI polygon."""
-        if self.parent_window and hasattr(self.parent_window, "inspection_service"):
-            self.parent_window.inspection_service.clear_roi_polygon()
+        if self._inspection is not None:
+            self._inspection.clear_roi_polygon()
 
         self.clear_roi_btn.setEnabled(False)
         self.reset_count_btn.setEnabled(False)
+        self._drop_stat("zone")
         self.zone_count_label.setText("Draw a polygon on the video to start counting")
-        self.zone_count_label.setStyleSheet(
-            f"color: {DarkTheme.TEXT_SECONDARY}; font-size: 12px; border: none;"
-        )
+        _set_status(self.zone_count_label, "muted")
 
         # Clear the inspection log when ROI is removed
-        if self.inspection_log_list is not None:
-            self.inspection_log_list.clear()
+        if self._log_model is not None:
+            self._log_model.clear()
 
     def _reset_roi_counts(self):
         """Reset zone counters without removing the polygon."""
-        if self.parent_window and hasattr(self.parent_window, "inspection_service"):
-            self.parent_window.inspection_service.reset_roi_counts()
+        if self._inspection is not None:
+            self._inspection.reset_roi_counts()
 
     def update_zone_counts(self, zone_count: int, total_entered: int):
         """Called from MainWindow to update the ROI zone counter display."""
-        if self.zone_count_label is not None:
-            self.zone_count_label.setText(
-                f"In zone: {zone_count}  |  Total entered: {total_entered}"
-            )
-            self.zone_count_label.setStyleSheet(
-                f"color: {DarkTheme.SUCCESS}; font-size: 12px; border: none;"
-            )
+        if self.zone_count_label is None:
+            return
+        if self._stat_unchanged("zone", (zone_count, total_entered)):
+            return
+        self.queue_stat(
+            "zone", f"In zone: {zone_count}  |  Total entered: {total_entered}"
+        )
+        _set_status(self.zone_count_label, "ok")
 
     # ================================================================
     # Two-Stage ROI Classification
@@ -931,31 +1163,36 @@ class HomePage(QWidget):
         if not model_path:
             return
 
-        if not self.parent_window or not hasattr(self.parent_window, "inspection_service"):
+        svc = self._inspection
+        if svc is None:
             return
 
-        svc = self.parent_window.inspection_service
-        success = svc.load_classifier(model_path)
+        # Off the GUI thread, like _load_model — checkpoint load is slow
+        self.load_classifier_btn.setEnabled(False)
+        self.classifier_status_label.setText("Loading classifier…")
+        run_in_background(
+            svc.load_classifier, model_path,
+            on_done=partial(self._on_classifier_loaded, model_path),
+        )
 
+    def _on_classifier_loaded(self, model_path: str, success):
+        """Update the classifier status once the background load finishes."""
+        self.load_classifier_btn.setEnabled(True)
         if success:
             short_name = model_path.replace("\\", "/").split("/")[-1]
             self.classifier_status_label.setText(f"✔ {short_name}")
-            self.classifier_status_label.setStyleSheet(
-                f"color: {DarkTheme.SUCCESS}; font-size: 11px; border: none;"
-            )
+            _set_status(self.classifier_status_label, "ok")
             self.load_classifier_btn.setText("📂  Change Classifier")
         else:
             self.classifier_status_label.setText("Failed to load classifier")
-            self.classifier_status_label.setStyleSheet(
-                f"color: {DarkTheme.ERROR}; font-size: 11px; border: none;"
-            )
+            _set_status(self.classifier_status_label, "error")
 
     def _clear_classification_log(self):
         """Clear the inspection log display and the service-side log."""
-        if self.inspection_log_list is not None:
-            self.inspection_log_list.clear()
-        if self.parent_window and hasattr(self.parent_window, "inspection_service"):
-            self.parent_window.inspection_service.clear_classification_log()
+        if self._log_model is not None:
+            self._log_model.clear()
+        if self._inspection is not None:
+            self._inspection.clear_classification_log()
 
     def update_classification_log(self, log: dict):
         """Called from MainWindow to refresh the inspection log list.
@@ -965,52 +1202,18 @@ class HomePage(QWidget):
         log : dict
             Mapping of ``tracker_id`` → ``{"label", "score", "timestamp"}``.
         """
-        if self.inspection_log_list is None:
+        if self._log_model is None:
             return
 
-        import time as _time
-
-        # Only append new entries (check count difference for efficiency)
-        current_count = self.inspection_log_list.count()
-        if len(log) == current_count:
+        # Only refresh when entries were added or removed
+        count = self._log_model.rowCount()
+        if len(log) == count:
             return  # no new entries
 
-        # Rebuild the list (simple approach — log is small)
-        self.inspection_log_list.clear()
-
-        # Sort by timestamp descending (newest first)
-        sorted_entries = sorted(
-            log.items(), key=lambda kv: kv[1].get("timestamp", 0), reverse=True
-        )
-
-        for tid, entry in sorted_entries:
-            ts = entry.get("timestamp", 0)
-            time_str = _time.strftime("%H:%M:%S", _time.localtime(ts)) if ts else "—"
-            label = entry.get("label", "?")
-            score = entry.get("score", 0)
-            cls_id = entry.get("id", -1)
-
-            item_text = f"#{tid}  ·  {label} {score:.0%}  ·  {time_str}"
-            item = QListWidgetItem(item_text)
-
-            # Colour-code: bad keywords → red text, otherwise → green
-            _bad_keywords = {"defect", "defective", "bad", "ng", "fail",
-                             "reject", "rejected", "nok", "damaged", "faulty"}
-            label_lower = label.lower()
-            is_defect = (
-                label_lower in _bad_keywords
-                or any(k in label_lower for k in _bad_keywords)
-            )
-            # Fallback for binary classifiers with numeric labels
-            if not is_defect and cls_id == 0 and label_lower in ("0", "class_0"):
-                is_defect = True
-
-            if is_defect:
-                item.setForeground(QColor(255, 80, 80))
-            else:
-                item.setForeground(QColor(80, 220, 80))
-
-            self.inspection_log_list.addItem(item)
+        if count and len(log) > count:
+            self._log_model.add_new(log)
+        else:
+            self._log_model.set_log(log)  # first fill, or entries dropped
 
     # ================================================================
     # Dataset Collection
@@ -1019,8 +1222,8 @@ class HomePage(QWidget):
     def _on_mode_changed(self, index: int):
         """Show/hide the frame-skip spinner depending on the selected mode."""
         is_image_mode = index == 0  # "Save Images" is first
-        self.frame_skip_spin.setVisible(is_image_mode)
-        self.frame_skip_label.setVisible(is_image_mode)
+        _set_visible(self.frame_skip_spin, is_image_mode)
+        _set_visible(self.frame_skip_label, is_image_mode)
 
     def _browse_output_dir(self):
         """Open folder picker for the dataset output directory."""
@@ -1033,37 +1236,19 @@ class HomePage(QWidget):
 
     def _toggle_collection(self):
         """Start or stop dataset collection."""
-        if not self.parent_window or not hasattr(self.parent_window, "dataset_service"):
+        svc = self._dataset
+        if svc is None:
             return
 
-        svc = self.parent_window.dataset_service
-
         if svc.is_collecting:
             svc.stop_collection()
             self.collection_btn.setText("⏺  Start Collection")
-            self.collection_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {DarkTheme.PRIMARY};
-                    color: white;
-                    border: none;
-                    border-radius: 8px;
-                    padding: 0 20px;
-                    font-size: 13px;
-                    font-weight: bold;
-                }}
-                QPushButton:hover {{
-                    background-color: {DarkTheme.PRIMARY_HOVER};
-                }}
-                QPushButton:pressed {{
-                    background-color: {DarkTheme.PRIMARY_PRESSED};
-                }}
-            """)
+            _set_qss(self.collection_btn, _PRIMARY_BTN_QSS)
+            self._drop_stat("collection")
             self.collection_status_label.setText(
                 f"Done — {svc.frames_saved} frames saved"
             )
-            self.collection_status_label.setStyleSheet(
-                f"color: {DarkTheme.TEXT_SECONDARY}; font-size: 12px; border: none;"
-            )
+            _set_status(self.collection_status_label, "muted")
             # Re-enable controls
             self.collection_mode_combo.setEnabled(True)
             self.frame_skip_spin.setEnabled(True)
@@ -1078,34 +1263,15 @@ class HomePage(QWidget):
             )
             if not ok:
                 self.collection_status_label.setText("Failed to start collection")
-                self.collection_status_label.setStyleSheet(
-                    f"color: {DarkTheme.ERROR}; font-size: 12px; border: none;"
-                )
+                _set_status(self.collection_status_label, "error")
                 return
 
             self.collection_btn.setText("⏹  Stop Collection")
-            self.collection_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {DarkTheme.ERROR};
-                    color: white;
-                    border: none;
-                    border-radius: 8px;
-                    padding: 0 20px;
-                    font-size: 13px;
-                    font-weight: bold;
-                }}
-                QPushButton:hover {{
-                    background-color: {DarkTheme.ERROR_HOVER};
-                }}
-                QPushButton:pressed {{
-                    background-color: {DarkTheme.ERROR_PRESSED};
-                }}
-            """)
+            _set_qss(self.collection_btn, _DANGER_BTN_QSS)
+
             label = "Recording video…" if mode == "video" else "Capturing images…"
             self.collection_status_label.setText(label)
-            self.collection_status_label.setStyleSheet(
-                f"color: {DarkTheme.SUCCESS}; font-size: 12px; border: none;"
-            )
+            _set_status(self.collection_status_label, "ok")
             # Disable controls while collecting
             self.collection_mode_combo.setEnabled(False)
             self.frame_skip_spin.setEnabled(False)
@@ -1114,14 +1280,14 @@ class HomePage(QWidget):
         """Called from MainWindow on each frame to update the counter."""
         if self.collection_status_label is None:
             return
-        svc = self.parent_window.dataset_service if self.parent_window else None
+        svc = self._dataset
         if svc and svc.is_collecting:
             if svc.mode == "video":
-                self.collection_status_label.setText(
-                    f"Recording… {frames_saved} frames"
-                )
+                self.queue_stat("collection", f"Recording… {frames_saved} frames")
             else:
-                self.collection_status_label.setText(
-                    f"Capturing… {frames_saved} images saved"
-                )
+                text = f"Capturing… {frames_saved} images saved"
+                pending = svc.pending_writes
+                if pending:
+                    text += f" ({pending} writing)"
+                self.queue_stat("collection", text)
 
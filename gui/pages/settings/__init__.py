@@ -1,12 +1,30 @@
-"""Settings modules for InspektLine GUI."""
+"""Settings modules for InspektLine GUI.
 
-from .base import BaseSettingsSection
-from .camera import CameraSettings
-from .detection import DetectionSettings
+Sections are imported on first attribute access (PEP 562), so importing
+the package does not pull in every section's widgets up front.
+"""
 
-__all__ = [
-    'BaseSettingsSection',
-    'CameraSettings',
-    'DetectionSettings',
-]
+from importlib import import_module
 
+# Public name → submodule that defines it
+_LAZY = {
+    'BaseSettingsSection': '.base',
+    'CameraSettings': '.camera',
+    'DetectionSettings': '.detection',
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value  # cache; later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,15 +1,58 @@
 """Base class for settings sections."""
 
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel
+from functools import partial
+
+from PySide6.QtWidgets import (QWidget, QVBoxLayout, QLabel, QLineEdit,
+                               QComboBox, QCheckBox)
 from PySide6.QtCore import Signal
-from gui.styles import DarkTheme
+from gui.styles import DarkTheme, StyleSheets
+
+
+# One stylesheet per section root; child labels pick their rule by
+# objectName and inputs by type, instead of each parsing its own sheet
+_SECTION_QSS = f"""
+    QWidget {{
+        background-color: {DarkTheme.BG_CARD};
+        border-radius: 12px;
+    }}
+    QLabel#sectionTitle {{
+        font-size: 20px; font-weight: bold; color: #fff;
+    }}
+    QLabel#fieldLabel {{
+        color: {DarkTheme.TEXT_SECONDARY}; font-size: 13px; margin-bottom: 8px;
+    }}
+    QLabel#infoNote {{
+        color: {DarkTheme.TEXT_SECONDARY}; font-size: 11px;
+        font-style: italic; margin-top: 6px;
+    }}
+""" + (StyleSheets.get_input_style()
+       + StyleSheets.get_combobox_style()
+       + StyleSheets.get_checkbox_style())
+
+# Sentinel for "handler not looked up yet" (None means "looked up, absent")
+_MISSING = object()
+
+# Field kind → how get_settings() reads / load_settings() writes the widget
+_GETTERS = {
+    "line": QLineEdit.text,
+    "combo": QComboBox.currentText,
+    "check": QCheckBox.isChecked,
+}
+_LOADERS = {
+    "line": lambda w, v: w.setText(str(v)),
+    "combo": lambda w, v: w.setCurrentText(str(v)),
+    "check": lambda w, v: w.setChecked(bool(v)),
+}
 
 
 class BaseSettingsSection(QWidget):
     """Base class for all settings sections with common functionality."""
 
-    # Signals for settings changes
-    settings_changed = Signal(str, object)  # (setting_name, value)
+    # Settings changed since the last commit(), as one notification
+    settings_batch_changed = Signal(dict)  # {setting_name: value}
+
+    # Applied once to the section root; subclasses append their own rules
+    SECTION_QSS = _SECTION_QSS
 
     def __init__(self, title: str, parent=None):
         """
@@ -22,16 +65,24 @@ class BaseSettingsSection(QWidget):
         super().__init__(parent)
         self.section_title = title
         self.parent_window = parent
+        # setting_name → parent handler (or None), resolved on first emit
+        self._handler_cache: dict = {}
+        # setting_name → last emitted value; repeats are not re-emitted
+        self._last: dict[str, object] = {}
+        # Changes not yet reported through settings_batch_changed
+        self._pending: dict[str, object] = {}
+        # Controls are built on first show or first settings access
+        self._built = False
+        # (setting_name, widget, kind) — drives get_settings/load_settings
+        self._fields: list[tuple[str, QWidget, str]] = []
+        # Parallel key / bound-getter lists so get_settings() is one zip
+        self._keys: list[str] = []
+        self._readers: list = []
         self._setup_section_ui()
 
     def _setup_section_ui(self):
         """Setup the section container with consistent styling."""
-        self.setStyleSheet(f"""
-            QWidget {{
-                background-color: {DarkTheme.BG_CARD};
-                border-radius: 12px;
-            }}
-        """)
+        self.setStyleSheet(self.SECTION_QSS)
 
         self.main_layout = QVBoxLayout(self)
         self.main_layout.setContentsMargins(25, 25, 25, 25)
@@ -39,44 +90,132 @@ class BaseSettingsSection(QWidget):
 
         # Add section title
         title = QLabel(self.section_title)
-        title.setStyleSheet("font-size: 20px; font-weight: bold; color: #fff;")
+        title.setObjectName("sectionTitle")
         self.main_layout.addWidget(title)
 
-    def add_field_label(self, text: str, top_margin: int = 0) -> QLabel:
+    def _ensure_built(self):
+        """Build the section's controls once, with repaints suspended."""
+        if self._built:
+            return
+        self._built = True
+        self.setUpdatesEnabled(False)
+        try:
+            self._build_controls()
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _build_controls(self):
+        """Create the section's widgets (called once by ``_ensure_built``)."""
+        raise NotImplementedError("Subclasses must implement _build_controls()")
+
+    def showEvent(self, event):
+        self._ensure_built()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self.commit()  # report this visit's edits in one notification
+        super().hideEvent(event)
+
+    def _register(self, setting_name: str, widget: QWidget, kind: str):
+        """
+        Register a widget as the value of *setting_name*.
+
+        Args:
+            setting_name: Key used in the settings dict
+            widget: The input widget
+            kind: ``"line"``, ``"combo"`` or ``"check"``
+        """
+        self._fields.append((setting_name, widget, kind))
+        self._keys.append(setting_name)
+        self._readers.append(partial(_GETTERS[kind], widget))
+
+    def add_field_label(self, text: str, top_margin: int = 0,
+                        layout=None) -> QLabel:
         """
         Add a field label with consistent styling.
 
         Args:
             text: Label text
             top_margin: Top margin in pixels
+            layout: Layout to append to (defaults to ``self.main_layout``)
 
         Returns:
             QLabel: The created label
         """
         label = QLabel(text)
-        style = f"color: {DarkTheme.TEXT_SECONDARY}; font-size: 13px; margin-bottom: 8px;"
+        label.setObjectName("fieldLabel")
         if top_margin > 0:
-            style += f" margin-top: {top_margin}px;"
-        label.setStyleSheet(style)
-        self.main_layout.addWidget(label)
+            label.setStyleSheet(f"margin-top: {top_margin}px;")
+        (layout if layout is not None else self.main_layout).addWidget(label)
         return label
 
+    def _add_line(self, setting_name: str, label: str, default: str = "", *,
+                  margin: int = 0, validator=None, height: int = 50,
+                  placeholder: str = "") -> QLineEdit:
+        """
+        Add a labelled line edit that emits *setting_name* when editing ends.
+
+        Args:
+            setting_name: Key used in the settings dict
+            label: Field label text
+            default: Initial text (assigned with signals blocked)
+            margin: Top margin of the label in pixels
+            validator: Optional QValidator for the input
+            height: Fixed height in pixels
+            placeholder: Hint shown when empty (defaults to *default*)
+
+        Returns:
+            QLineEdit: The created input
+        """
+        self.add_field_label(label, top_margin=margin)
+        line_edit = QLineEdit()
+        line_edit.setPlaceholderText(placeholder or default)
+        line_edit.blockSignals(True)
+        line_edit.setText(default)
+        line_edit.blockSignals(False)
+        if validator is not None:
+            line_edit.setValidator(validator)
+        line_edit.setFixedHeight(height)
+        line_edit.editingFinished.connect(
+            partial(self._commit_line, setting_name, line_edit))
+        self._register(setting_name, line_edit, "line")
+        self.main_layout.addWidget(line_edit)
+        return line_edit
+
+    def _commit_line(self, setting_name: str, line_edit: QLineEdit):
+        """Emit the line edit's final text (``editingFinished`` slot)."""
+        self.emit_setting_changed(setting_name, line_edit.text())
+
     def emit_setting_changed(self, setting_name: str, value):
         """
-        Emit a signal when a setting changes.
+        Apply a setting change through the parent window handler now and
+        queue it for the next ``settings_batch_changed`` notification.
 
         Args:
             setting_name: Name of the setting
             value: New value
         """
-        self.settings_changed.emit(setting_name, value)
+        if self._last.get(setting_name, _MISSING) == value:
+            return  # unchanged since the last emit
+        self._last[setting_name] = value
+        self._pending[setting_name] = value
 
         # Also call parent window handler if available
-        handler_name = f"on_{setting_name}_changed"
-        if self.parent_window and hasattr(self.parent_window, handler_name):
-            handler = getattr(self.parent_window, handler_name)
+        handler = self._handler_cache.get(setting_name, _MISSING)
+        if handler is _MISSING:
+            handler = (getattr(self.parent_window, f"on_{setting_name}_changed", None)
+                       if self.parent_window else None)
+            self._handler_cache[setting_name] = handler
+        if handler is not None:
             handler(value)
 
+    def commit(self):
+        """Emit ``settings_batch_changed`` once with all changes since the last call."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        self.settings_batch_changed.emit(pending)
+
     def get_settings(self) -> dict:
         """
         Get all current settings as a dictionary.
@@ -84,7 +223,8 @@ class BaseSettingsSection(QWidget):
         Returns:
             dict: Current settings
         """
-        raise NotImplementedError("Subclasses must implement get_settings()")
+        self._ensure_built()
+        return dict(zip(self._keys, [read() for read in self._readers]))
 
     def load_settings(self, settings: dict):
         """
@@ -93,5 +233,17 @@ class BaseSettingsSection(QWidget):
         Args:
             settings: Settings dictionary
         """
-        raise NotImplementedError("Subclasses must implement load_settings()")
+        self._ensure_built()
+        self._forget_settings(settings)
+        for key, widget, kind in self._fields:
+            if key in settings:
+                _LOADERS[kind](widget, settings[key])
+                # Loaded value is what the parent already has
+                self._last[key] = _GETTERS[kind](widget)
+
+    def _forget_settings(self, keys):
+        """Drop emit memo and buffered changes for *keys* (before a load)."""
+        for key in keys:
+            self._last.pop(key, None)
+            self._pending.pop(key, None)
 
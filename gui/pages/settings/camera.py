@@ -1,10 +1,29 @@
 """Camera settings section — camera type and device selection only."""
 
 from PySide6.QtWidgets import QComboBox, QLabel, QPushButton
-from gui.styles import StyleSheets, DarkTheme
+from PySide6.QtCore import Slot
+from gui.styles import DarkTheme
+from . import camera_types
 from .base import BaseSettingsSection
 
 
+# Section-specific rules, appended to the base section stylesheet
+_REFRESH_BTN_QSS = f"""
+    QPushButton#refreshButton {{
+        background-color: transparent;
+        color: {DarkTheme.PRIMARY};
+        border: 1px solid {DarkTheme.PRIMARY};
+        border-radius: 6px;
+        font-size: 12px;
+        padding: 0 16px;
+    }}
+    QPushButton#refreshButton:hover {{
+        background-color: {DarkTheme.PRIMARY};
+        color: white;
+    }}
+"""
+
+
 class CameraSettings(BaseSettingsSection):
     """Camera configuration settings section.
 
@@ -13,66 +32,50 @@ class CameraSettings(BaseSettingsSection):
     2. Camera Device — dynamically enumerated list for the selected type.
     """
 
-    # Mapping between UI display names and internal camera type identifiers
-    CAMERA_TYPE_MAP = {
-        "USB Webcam": "usb-standard",
-        "Intel RealSense": "intel-realsense",
-        "Daheng GigE": "daheng-gige",
-    }
-    CAMERA_TYPE_REVERSE = {v: k for k, v in CAMERA_TYPE_MAP.items()}
+    # Display name ↔ internal camera type (see camera_types)
+    CAMERA_TYPE_MAP = camera_types.CAMERA_TYPE_MAP
+    CAMERA_TYPE_REVERSE = camera_types.CAMERA_TYPE_REVERSE
+    CAMERA_TYPES = camera_types.CAMERA_TYPES
+    CAMERA_TYPE_INDEX = camera_types.CAMERA_TYPE_INDEX
+
+    SECTION_QSS = BaseSettingsSection.SECTION_QSS + _REFRESH_BTN_QSS
 
     def __init__(self, parent=None):
         super().__init__("Camera Configuration", parent)
         self._camera_service = None
-        self._init_controls()
 
     # ---- public API --------------------------------------------------------
 
     def set_camera_service(self, camera_service):
         """Inject camera service for device enumeration."""
         self._camera_service = camera_service
-        self._refresh_device_list()
+        if self._built:
+            self._refresh_device_list()
 
     # ---- UI setup ----------------------------------------------------------
 
-    def _init_controls(self):
+    def _build_controls(self):
         """Build the two combo-box controls."""
         # -- Camera Type -----------------------------------------------------
-        type_label = QLabel("Camera Type")
-        type_label.setStyleSheet(
-            f"color: {DarkTheme.TEXT_SECONDARY}; font-size: 13px; margin-bottom: 4px;"
-        )
-        self.main_layout.addWidget(type_label)
+        self.add_field_label("Camera Type")
 
         self.camera_type_combo = QComboBox()
-        self.camera_type_combo.addItems(list(self.CAMERA_TYPE_MAP.keys()))
-        self.camera_type_combo.setStyleSheet(StyleSheets.get_combobox_style())
+        self.camera_type_combo.addItems(self.CAMERA_TYPES)
         self.camera_type_combo.setFixedHeight(45)
         self.camera_type_combo.currentTextChanged.connect(self._on_type_changed)
         self.main_layout.addWidget(self.camera_type_combo)
 
         # -- Camera Device ---------------------------------------------------
-        device_label = QLabel("Camera Device")
-        device_label.setStyleSheet(
-            f"color: {DarkTheme.TEXT_SECONDARY}; font-size: 13px; "
-            f"margin-top: 12px; margin-bottom: 4px;"
-        )
-        self.main_layout.addWidget(device_label)
+        self.add_field_label("Camera Device", top_margin=12)
 
         self.camera_device_combo = QComboBox()
-        self.camera_device_combo.setStyleSheet(StyleSheets.get_combobox_style())
         self.camera_device_combo.setFixedHeight(45)
-        self.camera_device_combo.currentIndexChanged.connect(
-            lambda idx: self.emit_setting_changed("camera_device", idx)
-        )
+        self.camera_device_combo.currentIndexChanged.connect(self._on_device_changed)
         self.main_layout.addWidget(self.camera_device_combo)
 
         # -- Status label (shown when no devices found) ----------------------
         self.status_label = QLabel("")
-        self.status_label.setStyleSheet(
-            f"color: {DarkTheme.TEXT_SECONDARY}; font-size: 11px; "
-            f"font-style: italic; margin-top: 6px;"
-        )
+        self.status_label.setObjectName("infoNote")
         self.status_label.setWordWrap(True)
         self.status_label.hide()
         self.main_layout.addWidget(self.status_label)
@@ -80,34 +83,33 @@ class CameraSettings(BaseSettingsSection):
         # -- Refresh button --------------------------------------------------
         self.refresh_btn = QPushButton("Refresh devices")
         self.refresh_btn.setFixedHeight(36)
-        self.refresh_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {DarkTheme.PRIMARY};
-                border: 1px solid {DarkTheme.PRIMARY};
-                border-radius: 6px;
-                font-size: 12px;
-                padding: 0 16px;
-            }}
-            QPushButton:hover {{
-                background-color: {DarkTheme.PRIMARY};
-                color: white;
-            }}
-        """)
+        self.refresh_btn.setObjectName("refreshButton")
         self.refresh_btn.clicked.connect(self._refresh_device_list)
         self.main_layout.addWidget(self.refresh_btn)
 
         # Push everything to the top
         self.main_layout.addStretch()
 
+        if self._camera_service is not None:
+            self._refresh_device_list()
+
     # ---- slots / helpers ---------------------------------------------------
 
+    @Slot(str)
     def _on_type_changed(self, display_name: str):
         """Handle camera type combo change."""
         internal_type = self.CAMERA_TYPE_MAP.get(display_name, "usb-standard")
         self.emit_setting_changed("camera_type", internal_type)
+        # Device indices restart per type — index 0 of the new type is news
+        self._last.pop("camera_device", None)
         self._refresh_device_list()
 
+    @Slot(int)
+    def _on_device_changed(self, index: int):
+        """Handle camera device combo change."""
+        self.emit_setting_changed("camera_device", index)
+
+    @Slot()
     def _refresh_device_list(self):
         """Re-enumerate devices for the currently selected camera type."""
         internal_type = self.CAMERA_TYPE_MAP.get(
@@ -121,30 +123,35 @@ class CameraSettings(BaseSettingsSection):
             except Exception as exc:
                 print(f"[CameraSettings] Enumeration error: {exc}")
 
-        self.camera_device_combo.blockSignals(True)
-        self.camera_device_combo.clear()
+        items = [(dev.get("name", f"Device {dev['index']}"), dev["index"])
+                 for dev in devices]
+        combo = self.camera_device_combo
+        if items and items == [(combo.itemText(i), combo.itemData(i))
+                               for i in range(combo.count())]:
+            return  # same devices — keep the items and the current selection
+
+        combo.blockSignals(True)
+        combo.clear()
 
-        if devices:
-            for dev in devices:
-                self.camera_device_combo.addItem(
-                    dev.get("name", f"Device {dev['index']}"),
-                    userData=dev["index"],
-                )
+        if items:
+            for name, index in items:
+                combo.addItem(name, userData=index)
             self.status_label.hide()
         else:
-            self.camera_device_combo.addItem("No devices found")
+            combo.addItem("No devices found")
             self.status_label.setText(
                 "No cameras detected for this type. "
                 "Check connections and drivers."
             )
             self.status_label.show()
 
-        self.camera_device_combo.blockSignals(False)
+        combo.blockSignals(False)
 
     # ---- settings persistence helpers --------------------------------------
 
     def get_settings(self) -> dict:
         """Return current widget state as a dict."""
+        self._ensure_built()
         device_data = self.camera_device_combo.currentData()
         return {
             "camera_type": self.CAMERA_TYPE_MAP.get(
@@ -155,11 +162,13 @@ class CameraSettings(BaseSettingsSection):
 
     def load_settings(self, settings: dict):
         """Populate widgets from a dict (e.g. from SettingsService)."""
+        self._ensure_built()
+        self._forget_settings(settings)
         if "camera_type" in settings:
             display = self.CAMERA_TYPE_REVERSE.get(
                 settings["camera_type"], settings["camera_type"]
             )
-            idx = self.camera_type_combo.findText(display)
+            idx = self.CAMERA_TYPE_INDEX.get(display, -1)
             if idx >= 0:
                 self.camera_type_combo.setCurrentIndex(idx)
 
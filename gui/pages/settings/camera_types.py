@@ -0,0 +1,15 @@
+"""Camera type names shared by the settings page and settings section.
+
+Kept free of widget imports so importing them doesn't load the sections.
+"""
+
+# Mapping between UI display names and internal camera type identifiers
+CAMERA_TYPE_MAP = {
+    "USB Webcam": "usb-standard",
+    "Intel RealSense": "intel-realsense",
+    "Daheng GigE": "daheng-gige",
+}
+CAMERA_TYPE_REVERSE = {v: k for k, v in CAMERA_TYPE_MAP.items()}
+# Combo options, in display order, and display name → combo index
+CAMERA_TYPES = tuple(CAMERA_TYPE_MAP)
+CAMERA_TYPE_INDEX = {name: i for i, name in enumerate(CAMERA_TYPES)}
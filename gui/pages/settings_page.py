@@ -1,10 +1,93 @@
 """Settings page — camera selection and camera parameters."""
 
-from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-                                QPushButton, QFrame, QComboBox, QSlider,
-                                QCheckBox, QScrollArea)
-from PySide6.QtCore import Signal, Qt
+from functools import partial
+
+from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
+                                QLabel, QPushButton, QFrame, QComboBox,
+                                QSlider, QCheckBox, QScrollArea)
+from PySide6.QtCore import Signal, Slot, Qt, QTimer
+from gui.components import Card
 from gui.styles import DarkTheme, StyleSheets
+from gui.workers import run_in_background
+from gui.pages.settings import camera_types
+
+
+# Parameter-row styles — rows are rebuilt on every camera/device change,
+# so their QSS is formatted once here rather than per row.
+_PARAM_LABEL_QSS = f"color: {DarkTheme.TEXT_SECONDARY}; font-size: 12px;"
+_PARAM_VALUE_QSS = f"color: {DarkTheme.TEXT_PRIMARY}; font-size: 12px; font-weight: 500;"
+_RANGE_LABEL_QSS = f"color: {DarkTheme.TEXT_DISABLED}; font-size: 10px;"
+_PLACEHOLDER_QSS = f"color: {DarkTheme.TEXT_SECONDARY}; font-size: 12px; font-style: italic;"
+_CHECKBOX_QSS = StyleSheets.get_checkbox_style()
+_COMBO_QSS = StyleSheets.get_combobox_style()
+_SLIDER_QSS = f"""
+    QSlider::groove:horizontal {{
+        background: {DarkTheme.BG_INPUT}; height: 6px; border-radius: 3px;
+    }}
+    QSlider::handle:horizontal {{
+        background: {DarkTheme.PRIMARY}; border: 2px solid white;
+        width: 14px; height: 14px; margin: -5px 0; border-radius: 8px;
+    }}
+    QSlider::sub-page:horizontal {{
+        background: {DarkTheme.PRIMARY}; border-radius: 3px;
+    }}
+"""
+
+# Page chrome — formatted once at import rather than per page instance
+_SUBTITLE_QSS = f"font-size: 13px; color: {DarkTheme.TEXT_SECONDARY};"
+_FIELD_LABEL_QSS = f"font-size: 12px; color: {DarkTheme.TEXT_SECONDARY};"
+_FIELD_LABEL_MARGIN_QSS = _FIELD_LABEL_QSS + " margin-top: {}px;"
+_STATUS_QSS = (f"color: {DarkTheme.TEXT_SECONDARY}; font-size: 11px; "
+               f"font-style: italic; margin-top: 4px;")
+_DONE_BTN_QSS = f"""
+    QPushButton {{
+        background-color: {DarkTheme.PRIMARY};
+        color: white; border: none; border-radius: 6px;
+        font-size: 14px; font-weight: 500;
+    }}
+    QPushButton:hover {{ background-color: {DarkTheme.PRIMARY_HOVER}; }}
+"""
+_CLOSE_BTN_QSS = f"""
+    QPushButton {{
+        background-color: transparent;
+        color: {DarkTheme.TEXT_SECONDARY};
+        border: none; font-size: 24px;
+    }}
+    QPushButton:hover {{ color: {DarkTheme.TEXT_PRIMARY}; }}
+"""
+_REFRESH_BTN_QSS = f"""
+    QPushButton {{
+        background-color: transparent;
+        color: {DarkTheme.PRIMARY};
+        border: 1px solid {DarkTheme.PRIMARY};
+        border-radius: 6px; font-size: 12px; padding: 0 16px;
+    }}
+    QPushButton:hover {{
+        background-color: {DarkTheme.PRIMARY}; color: white;
+    }}
+"""
+
+
+def _vbox(widget=None, margins=0, spacing=None):
+    """Create a QVBoxLayout with uniform or (l, t, r, b) margins."""
+    layout = QVBoxLayout(widget) if widget is not None else QVBoxLayout()
+    _apply_box(layout, margins, spacing)
+    return layout
+
+
+def _hbox(widget=None, margins=0, spacing=None):
+    """Create a QHBoxLayout with uniform or (l, t, r, b) margins."""
+    layout = QHBoxLayout(widget) if widget is not None else QHBoxLayout()
+    _apply_box(layout, margins, spacing)
+    return layout
+
+
+def _apply_box(layout, margins, spacing):
+    if isinstance(margins, int):
+        margins = (margins,) * 4
+    layout.setContentsMargins(*margins)
+    if spacing is not None:
+        layout.setSpacing(spacing)
 
 
 class SettingsPage(QWidget):
@@ -16,13 +99,12 @@ class SettingsPage(QWidget):
     # Signal when settings dialog should close
     close_requested = Signal()
 
-    # Mapping between UI display names and internal camera type identifiers
-    CAMERA_TYPE_MAP = {
-        "USB Webcam": "usb-standard",
-        "Intel RealSense": "intel-realsense",
-        "Daheng GigE": "daheng-gige",
-    }
-    CAMERA_TYPE_REVERSE = {v: k for k, v in CAMERA_TYPE_MAP.items()}
+    # Display name ↔ internal camera type — one definition, shared with
+    # the CameraSettings section (widget-free module, no section import)
+    CAMERA_TYPE_MAP = camera_types.CAMERA_TYPE_MAP
+    CAMERA_TYPE_REVERSE = camera_types.CAMERA_TYPE_REVERSE
+    CAMERA_TYPES = camera_types.CAMERA_TYPES
+    CAMERA_TYPE_INDEX = camera_types.CAMERA_TYPE_INDEX
 
     def __init__(self, settings_service=None, camera_service=None,
                  inspection_service=None, parent=None, **kwargs):
@@ -32,6 +114,22 @@ class SettingsPage(QWidget):
         self._parent_window = parent
         # Keeps references to dynamically-created parameter widgets
         self._param_widgets: dict[str, dict] = {}
+        # Bumped per enumeration request; stale results are dropped
+        self._device_request = 0
+        # Scrolling through the camera-type combo fires one change per step;
+        # only enumerate devices once the selection settles.
+        self._device_refresh_timer = QTimer(self)
+        self._device_refresh_timer.setSingleShot(True)
+        self._device_refresh_timer.setInterval(80)
+        self._device_refresh_timer.timeout.connect(self._populate_camera_devices)
+        # Slider drags fire valueChanged on every step; camera writes are
+        # coalesced to at most one per 50 ms (each is an SDK round-trip),
+        # and flushed immediately when the slider is released.
+        self._pending_params: dict[str, object] = {}
+        self._param_write_timer = QTimer(self)
+        self._param_write_timer.setSingleShot(True)
+        self._param_write_timer.setInterval(50)
+        self._param_write_timer.timeout.connect(self._flush_param_writes)
         self.init_ui()
 
     # ================================================================
@@ -39,9 +137,15 @@ class SettingsPage(QWidget):
     # ================================================================
 
     def init_ui(self):
-        main_layout = QVBoxLayout(self)
-        main_layout.setContentsMargins(0, 0, 0, 0)
-        main_layout.setSpacing(0)
+        """Build the page with repaints suspended until every child exists."""
+        self.setUpdatesEnabled(False)
+        try:
+            self._build_ui()
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _build_ui(self):
+        main_layout = _vbox(self, spacing=0)
 
         # Scrollable content
         scroll = QScrollArea()
@@ -50,9 +154,7 @@ class SettingsPage(QWidget):
         scroll.setStyleSheet("QScrollArea { border: none; background: transparent; }")
 
         content = QWidget()
-        self._content_layout = QVBoxLayout(content)
-        self._content_layout.setContentsMargins(30, 25, 30, 25)
-        self._content_layout.setSpacing(25)
+        self._content_layout = _vbox(content, (30, 25, 30, 25), 25)
 
         # Header
         self._content_layout.addWidget(self._create_header())
@@ -73,14 +175,7 @@ class SettingsPage(QWidget):
         btn_row.addStretch()
         self.done_button = QPushButton("Done")
         self.done_button.setFixedSize(100, 40)
-        self.done_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {DarkTheme.PRIMARY};
-                color: white; border: none; border-radius: 6px;
-                font-size: 14px; font-weight: 500;
-            }}
-            QPushButton:hover {{ background-color: {DarkTheme.PRIMARY_HOVER}; }}
-        """)
+        self.done_button.setStyleSheet(_DONE_BTN_QSS)
         self.done_button.clicked.connect(self._on_done_clicked)
         btn_row.addWidget(self.done_button)
         self._content_layout.addLayout(btn_row)
@@ -92,32 +187,21 @@ class SettingsPage(QWidget):
 
     def _create_header(self):
         header = QWidget()
-        hl = QHBoxLayout(header)
-        hl.setContentsMargins(0, 0, 0, 0)
+        hl = _hbox(header)
 
-        tc = QWidget()
-        tl = QVBoxLayout(tc)
-        tl.setContentsMargins(0, 0, 0, 0)
-        tl.setSpacing(5)
+        tl = _vbox(spacing=5)
         title = QLabel("Settings")
         title.setStyleSheet("font-size: 24px; font-weight: bold; color: #fff;")
         tl.addWidget(title)
         subtitle = QLabel("Select camera and adjust parameters")
-        subtitle.setStyleSheet(f"font-size: 13px; color: {DarkTheme.TEXT_SECONDARY};")
+        subtitle.setStyleSheet(_SUBTITLE_QSS)
         tl.addWidget(subtitle)
-        hl.addWidget(tc)
+        hl.addLayout(tl)
         hl.addStretch()
 
         close_btn = QPushButton("\u00d7")
         close_btn.setFixedSize(32, 32)
-        close_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {DarkTheme.TEXT_SECONDARY};
-                border: none; font-size: 24px;
-            }}
-            QPushButton:hover {{ color: {DarkTheme.TEXT_PRIMARY}; }}
-        """)
+        close_btn.setStyleSheet(_CLOSE_BTN_QSS)
         close_btn.clicked.connect(self._on_close_clicked)
         hl.addWidget(close_btn)
         return header
@@ -129,16 +213,8 @@ class SettingsPage(QWidget):
         lbl.setStyleSheet("font-size: 14px; font-weight: 600; color: #fff; margin-bottom: 8px;")
         return lbl
 
-    def _card(self):
-        card = QFrame()
-        card.setStyleSheet(f"""
-            QFrame {{
-                background-color: {DarkTheme.BG_SECONDARY};
-                border: 1px solid {DarkTheme.BORDER_PRIMARY};
-                border-radius: 10px; padding: 15px;
-            }}
-        """)
-        return card
+    def _card(self, spacing=12):
+        return Card(margins=15, spacing=spacing)
 
     # ================================================================
     # Camera Selection
@@ -146,88 +222,103 @@ class SettingsPage(QWidget):
 
     def _create_camera_section(self):
         container = QWidget()
-        layout = QVBoxLayout(container)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(8)
+        layout = _vbox(container, spacing=8)
         layout.addWidget(self._section_title("Camera Selection"))
 
         card = self._card()
-        cl = QVBoxLayout(card)
-        cl.setContentsMargins(15, 15, 15, 15)
-        cl.setSpacing(12)
+        cl = card.body
 
         # Camera Type
         cl.addWidget(self._field_label("Camera Type"))
         self.camera_type_combo = QComboBox()
-        self.camera_type_combo.addItems(list(self.CAMERA_TYPE_MAP.keys()))
-        self.camera_type_combo.setStyleSheet(StyleSheets.get_combobox_style())
+        self.camera_type_combo.addItems(self.CAMERA_TYPES)
+        self.camera_type_combo.setStyleSheet(_COMBO_QSS)
         self.camera_type_combo.setFixedHeight(45)
         cl.addWidget(self.camera_type_combo)
 
         if self._settings:
             display = self.CAMERA_TYPE_REVERSE.get(
                 self._settings.camera.camera_type, "USB Webcam")
-            idx = self.camera_type_combo.findText(display)
+            idx = self.CAMERA_TYPE_INDEX.get(display, -1)
             if idx >= 0:
                 self.camera_type_combo.setCurrentIndex(idx)
 
         # Camera Device
         cl.addWidget(self._field_label("Camera Device", margin_top=6))
         self.camera_device_combo = QComboBox()
-        self.camera_device_combo.setStyleSheet(StyleSheets.get_combobox_style())
+        self.camera_device_combo.setStyleSheet(_COMBO_QSS)
         self.camera_device_combo.setFixedHeight(45)
         cl.addWidget(self.camera_device_combo)
 
         self.status_label = QLabel("")
-        self.status_label.setStyleSheet(
-            f"color: {DarkTheme.TEXT_SECONDARY}; font-size: 11px; "
-            f"font-style: italic; margin-top: 4px;")
+        self.status_label.setStyleSheet(_STATUS_QSS)
         self.status_label.setWordWrap(True)
         self.status_label.hide()
         cl.addWidget(self.status_label)
 
         self.refresh_btn = QPushButton("Refresh devices")
         self.refresh_btn.setFixedHeight(36)
-        self.refresh_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {DarkTheme.PRIMARY};
-                border: 1px solid {DarkTheme.PRIMARY};
-                border-radius: 6px; font-size: 12px; padding: 0 16px;
-            }}
-            QPushButton:hover {{
-                background-color: {DarkTheme.PRIMARY}; color: white;
-            }}
-        """)
+        self.refresh_btn.setStyleSheet(_REFRESH_BTN_QSS)
         self.refresh_btn.clicked.connect(self._populate_camera_devices)
         cl.addWidget(self.refresh_btn)
 
         layout.addWidget(card)
 
         self.camera_type_combo.currentIndexChanged.connect(
-            lambda _: self._populate_camera_devices())
+            self._schedule_device_refresh)
         self._populate_camera_devices()
 
         return container
 
     def _field_label(self, text, margin_top=0):
         lbl = QLabel(text)
-        style = f"font-size: 12px; color: {DarkTheme.TEXT_SECONDARY};"
-        if margin_top:
-            style += f" margin-top: {margin_top}px;"
-        lbl.setStyleSheet(style)
+        lbl.setStyleSheet(_FIELD_LABEL_QSS if not margin_top
+                          else _FIELD_LABEL_MARGIN_QSS.format(margin_top))
         return lbl
 
+    @Slot(int)
+    def _schedule_device_refresh(self, _index=None):
+        """(Re)start the debounce timer; restarts collapse into one refresh."""
+        self._device_refresh_timer.start()
+
+    @Slot()
     def _populate_camera_devices(self):
+        """Enumerate devices for the selected camera type on the thread pool.
+
+        Driver enumeration (GigE discovery in particular) can block for
+        seconds; the combo shows a placeholder until the result arrives.
+        """
+        self._device_refresh_timer.stop()  # a direct refresh supersedes it
         internal_type = self.CAMERA_TYPE_MAP.get(
             self.camera_type_combo.currentText(), "usb-standard")
 
-        devices = []
-        if self._camera is not None:
-            try:
-                devices = self._camera.get_cameras_list(internal_type)
-            except Exception as exc:
-                print(f"[SettingsPage] Enumeration error: {exc}")
+        if self._camera is None:
+            self._on_devices_enumerated(self._device_request, [])
+            return
+
+        self._device_request += 1
+        self.camera_device_combo.blockSignals(True)
+        self.camera_device_combo.clear()
+        self.camera_device_combo.addItem("Searching for devices…")
+        self.camera_device_combo.blockSignals(False)
+        self.refresh_btn.setEnabled(False)
+        run_in_background(self._enumerate_devices, internal_type,
+                          on_done=partial(self._on_devices_enumerated,
+                                          self._device_request))
+
+    def _enumerate_devices(self, internal_type: str) -> list:
+        """Worker-thread half of :meth:`_populate_camera_devices`."""
+        try:
+            return self._camera.get_cameras_list(internal_type)
+        except Exception as exc:
+            print(f"[SettingsPage] Enumeration error: {exc}")
+            return []
+
+    def _on_devices_enumerated(self, request: int, devices):
+        if request != self._device_request:
+            return  # the camera type changed while enumerating
+        self.refresh_btn.setEnabled(True)
+        devices = devices or []
 
         self.camera_device_combo.blockSignals(True)
         self.camera_device_combo.clear()
@@ -260,22 +351,17 @@ class SettingsPage(QWidget):
     def _create_params_section(self):
         """Create the (initially hidden) camera parameters card."""
         self._params_container = QWidget()
-        layout = QVBoxLayout(self._params_container)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(8)
+        layout = _vbox(self._params_container, spacing=8)
 
         layout.addWidget(self._section_title("Camera Parameters"))
 
-        self._params_card = self._card()
-        self._params_card_layout = QVBoxLayout(self._params_card)
-        self._params_card_layout.setContentsMargins(15, 15, 15, 15)
-        self._params_card_layout.setSpacing(14)
+        self._params_card = self._card(spacing=14)
+        self._params_card_layout = self._params_card.body
 
         # Placeholder text (shown when no params available)
         self._params_placeholder = QLabel(
             "Camera parameters will appear here once a supported camera is connected.")
-        self._params_placeholder.setStyleSheet(
-            f"color: {DarkTheme.TEXT_SECONDARY}; font-size: 12px; font-style: italic;")
+        self._params_placeholder.setStyleSheet(_PLACEHOLDER_QSS)
         self._params_placeholder.setWordWrap(True)
         self._params_card_layout.addWidget(self._params_placeholder)
 
@@ -283,13 +369,28 @@ class SettingsPage(QWidget):
         return self._params_container
 
     def _refresh_parameters(self):
-        """Query the camera service for available parameters and rebuild controls."""
-        # Clear existing parameter widgets
+        """Query the camera service for available parameters and rebuild controls.
+
+        Repaints of the card are suspended during the rebuild so removing
+        and adding every row costs one layout/paint pass, not one per row.
+        """
+        self._params_card.setUpdatesEnabled(False)
+        try:
+            self._rebuild_parameter_rows()
+        finally:
+            self._params_card.setUpdatesEnabled(True)
+
+    def _rebuild_parameter_rows(self):
+        # Send any queued slider value before its widgets go away
+        self._flush_param_writes()
+        # Clear existing parameter widgets (the placeholder is kept for reuse)
         self._param_widgets.clear()
         while self._params_card_layout.count():
             item = self._params_card_layout.takeAt(0)
             w = item.widget()
-            if w:
+            if w is self._params_placeholder:
+                w.hide()
+            elif w:
                 w.deleteLater()
 
         params: list[dict] = []
@@ -300,12 +401,8 @@ class SettingsPage(QWidget):
                 pass
 
         if not params:
-            self._params_placeholder = QLabel(
-                "Camera parameters will appear here once a supported camera is connected.")
-            self._params_placeholder.setStyleSheet(
-                f"color: {DarkTheme.TEXT_SECONDARY}; font-size: 12px; font-style: italic;")
-            self._params_placeholder.setWordWrap(True)
             self._params_card_layout.addWidget(self._params_placeholder)
+            self._params_placeholder.show()
             return
 
         for p in params:
@@ -356,30 +453,29 @@ class SettingsPage(QWidget):
 
         row = QWidget()
         row.setStyleSheet("background: transparent;")
-        vl = QVBoxLayout(row)
-        vl.setContentsMargins(0, 0, 0, 0)
-        vl.setSpacing(4)
+        # One grid for the whole row: label | value, slider, min | max
+        grid = QGridLayout(row)
+        grid.setContentsMargins(0, 0, 0, 0)
+        grid.setVerticalSpacing(4)
+        grid.setColumnStretch(0, 1)
+        grid.setColumnStretch(1, 1)
 
-        # Top: label + value readout
-        top = QHBoxLayout()
         lbl = QLabel(label_text)
-        lbl.setStyleSheet(f"color: {DarkTheme.TEXT_SECONDARY}; font-size: 12px;")
-        top.addWidget(lbl)
-        top.addStretch()
+        lbl.setStyleSheet(_PARAM_LABEL_QSS)
+        grid.addWidget(lbl, 0, 0)
 
         display_val = f"{val:.2f}" if kind == "float" else str(int(val))
         if unit:
             display_val += f" {unit}"
         val_lbl = QLabel(display_val)
-        val_lbl.setStyleSheet(f"color: {DarkTheme.TEXT_PRIMARY}; font-size: 12px; font-weight: 500;")
+        val_lbl.setStyleSheet(_PARAM_VALUE_QSS)
         val_lbl.setMinimumWidth(80)
         val_lbl.setAlignment(Qt.AlignmentFlag.AlignRight)
-        top.addWidget(val_lbl)
-        vl.addLayout(top)
+        grid.addWidget(val_lbl, 0, 1)
 
         # Slider — always integer internally; for floats we scale ×100
         slider = QSlider(Qt.Orientation.Horizontal)
-        slider.setStyleSheet(self._slider_style())
+        slider.setStyleSheet(_SLIDER_QSS)
 
         if kind == "float":
             scale = 100
@@ -394,84 +490,79 @@ class SettingsPage(QWidget):
             slider.setValue(int(val))
             slider.setSingleStep(max(1, int(inc)))
 
-        # On change → update value label + send to camera
-        def _on_changed(raw, _key=key, _kind=kind, _unit=unit, _scale=scale, _lbl=val_lbl):
-            real = raw / _scale if _kind == "float" else raw
-            disp = f"{real:.2f}" if _kind == "float" else str(int(real))
-            if _unit:
-                disp += f" {_unit}"
-            _lbl.setText(disp)
-            if self._camera is not None:
-                self._camera.set_camera_parameter(_key, real)
+        # On change → update value label + queue the camera write
+        slider.valueChanged.connect(partial(self._on_slider_changed, key))
+        slider.sliderReleased.connect(self._flush_param_writes)
 
-        slider.valueChanged.connect(_on_changed)
-
-        vl.addWidget(slider)
+        grid.addWidget(slider, 1, 0, 1, 2)
 
         # Range labels
-        range_row = QHBoxLayout()
         lo_lbl = QLabel(f"{lo:.2f}" if kind == "float" else str(int(lo)))
-        lo_lbl.setStyleSheet(f"color: {DarkTheme.TEXT_DISABLED}; font-size: 10px;")
-        range_row.addWidget(lo_lbl)
-        range_row.addStretch()
+        lo_lbl.setStyleSheet(_RANGE_LABEL_QSS)
+        grid.addWidget(lo_lbl, 2, 0)
         hi_lbl = QLabel(f"{hi:.2f}" if kind == "float" else str(int(hi)))
-        hi_lbl.setStyleSheet(f"color: {DarkTheme.TEXT_DISABLED}; font-size: 10px;")
+        hi_lbl.setStyleSheet(_RANGE_LABEL_QSS)
         hi_lbl.setAlignment(Qt.AlignmentFlag.AlignRight)
-        range_row.addWidget(hi_lbl)
-        vl.addLayout(range_row)
+        grid.addWidget(hi_lbl, 2, 1)
 
-        self._param_widgets[key] = {"slider": slider, "val_lbl": val_lbl, "scale": scale}
+        self._param_widgets[key] = {"slider": slider, "val_lbl": val_lbl, "scale": scale,
+                                    "kind": kind, "unit": unit}
         return row
 
+    def _on_slider_changed(self, key: str, raw: int):
+        """Update the value label now; defer the camera write to the timer."""
+        w = self._param_widgets[key]
+        real = raw / w["scale"] if w["kind"] == "float" else raw
+        disp = f"{real:.2f}" if w["kind"] == "float" else str(int(real))
+        if w["unit"]:
+            disp += f" {w['unit']}"
+        w["val_lbl"].setText(disp)
+        self._pending_params[key] = real
+        if not self._param_write_timer.isActive():
+            self._param_write_timer.start()
+
+    def _on_toggle_changed(self, key: str, checked: bool):
+        """Send a boolean parameter straight to the camera."""
+        if self._camera is not None:
+            self._camera.set_camera_parameter(key, checked)
+
+    @Slot()
+    def _flush_param_writes(self):
+        """Send the latest queued value of each changed parameter."""
+        self._param_write_timer.stop()
+        pending, self._pending_params = self._pending_params, {}
+        if self._camera is not None:
+            for key, value in pending.items():
+                self._camera.set_camera_parameter(key, value)
+
     def _build_toggle_row(self, p: dict) -> QWidget:
         """Build a labelled checkbox for a boolean/enum_auto parameter."""
         key = p["key"]
         row = QWidget()
         row.setStyleSheet("background: transparent;")
-        hl = QHBoxLayout(row)
-        hl.setContentsMargins(0, 0, 0, 0)
+        hl = _hbox(row)
 
         cb = QCheckBox(p["label"])
         cb.setChecked(bool(p["value"]))
-        cb.setStyleSheet(StyleSheets.get_checkbox_style())
-
-        def _toggled(state, _key=key):
-            checked = state == Qt.CheckState.Checked.value
-            if self._camera is not None:
-                self._camera.set_camera_parameter(_key, checked)
+        cb.setStyleSheet(_CHECKBOX_QSS)
 
-        cb.stateChanged.connect(_toggled)
+        cb.toggled.connect(partial(self._on_toggle_changed, key))
         hl.addWidget(cb)
 
         self._param_widgets[key] = {"checkbox": cb}
         return row
 
-    # ---- slider style (inline, matching app theme) -------------------------
-
-    @staticmethod
-    def _slider_style():
-        return f"""
-            QSlider::groove:horizontal {{
-                background: {DarkTheme.BG_INPUT}; height: 6px; border-radius: 3px;
-            }}
-            QSlider::handle:horizontal {{
-                background: {DarkTheme.PRIMARY}; border: 2px solid white;
-                width: 14px; height: 14px; margin: -5px 0; border-radius: 8px;
-            }}
-            QSlider::sub-page:horizontal {{
-                background: {DarkTheme.PRIMARY}; border-radius: 3px;
-            }}
-        """
-
     # ================================================================
     # Save / Close
     # ================================================================
 
+    @Slot()
     def _on_close_clicked(self):
         self.close_requested.emit()
         if self.parent() and hasattr(self.parent(), 'close'):
             self.parent().close()
 
+    @Slot()
     def _on_done_clicked(self):
         self._save_settings()
         self._on_close_clicked()
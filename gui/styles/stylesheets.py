@@ -1,12 +1,19 @@
 """Stylesheet definitions for UI components."""
 
+from functools import lru_cache
+
 from .themes import DarkTheme
 
 
 class StyleSheets:
-    """Collection of reusable stylesheets."""
+    """Collection of reusable stylesheets.
+
+    Each getter is cached, so the f-string is built once and every caller
+    gets the same string object back.
+    """
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_icon_button_style():
         """Get stylesheet for icon buttons."""
         return f"""
@@ -27,6 +34,7 @@ class StyleSheets:
         """
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_slider_style():
         """Get stylesheet for sliders."""
         return f"""
@@ -48,6 +56,7 @@ class StyleSheets:
         """
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_combobox_style():
         """Get stylesheet for combo boxes."""
         return f"""
@@ -84,6 +93,7 @@ class StyleSheets:
         """
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_checkbox_style():
         """Get stylesheet for checkboxes."""
         return f"""
@@ -107,6 +117,7 @@ class StyleSheets:
         """
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_input_style():
         """Get stylesheet for text input fields."""
         return f"""
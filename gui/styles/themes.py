@@ -1,5 +1,7 @@
 """Theme definitions for the InspektLine GUI."""
 
+from PySide6.QtGui import QColor, QPalette
+
 
 class DarkTheme:
     """Dark theme color definitions."""
@@ -46,16 +48,40 @@ class DarkTheme:
     # Overlay
     OVERLAY_DARK = "rgba(0, 0, 0, 0.7)"
 
+    @classmethod
+    def get_palette(cls):
+        """Get the application palette (set once on ``QApplication``).
+
+        Plain window/text colours come from the palette rather than a
+        universal ``QWidget`` stylesheet rule, so widgets without their own
+        rules are not routed through the stylesheet engine.
+        """
+        palette = QPalette()
+        Role = QPalette.ColorRole
+        palette.setColor(Role.Window, QColor(cls.BG_PRIMARY))
+        palette.setColor(Role.Base, QColor(cls.BG_INPUT))
+        palette.setColor(Role.AlternateBase, QColor(cls.BG_CARD))
+        palette.setColor(Role.Button, QColor(cls.BG_INPUT))
+        for role in (Role.WindowText, Role.Text, Role.ButtonText):
+            palette.setColor(role, QColor(cls.TEXT_PRIMARY))
+            palette.setColor(QPalette.ColorGroup.Disabled, role,
+                             QColor(cls.TEXT_DISABLED))
+        palette.setColor(Role.PlaceholderText, QColor(cls.TEXT_SECONDARY))
+        palette.setColor(Role.Highlight, QColor(cls.PRIMARY))
+        palette.setColor(Role.HighlightedText, QColor(cls.TEXT_PRIMARY))
+        return palette
+
     @classmethod
     def get_main_window_style(cls):
-        """Get main window stylesheet."""
+        """Get main window stylesheet (pair with :meth:`get_palette`)."""
         return f"""
-            QMainWindow {{
-                background-color: {cls.BG_PRIMARY};
+            QFrame#card {{
+                background-color: transparent;
+                border: none;
+                padding: 15px;
             }}
-            QWidget {{
-                background-color: {cls.BG_PRIMARY};
-                color: {cls.TEXT_PRIMARY};
+            QFrame#card QLabel {{
+                background-color: transparent;
             }}
         """
 
@@ -0,0 +1,48 @@
+"""Background workers for the GUI — run blocking calls off the Qt main thread."""
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+
+class _TaskSignals(QObject):
+    """Signal carrier — QRunnable is not a QObject and cannot emit itself."""
+
+    finished = Signal(object)
+
+
+class BackgroundTask(QRunnable):
+    """Run ``fn(*args)`` on the global thread pool.
+
+    The return value is delivered through ``signals.finished`` on the
+    thread that created the task (normally the GUI thread), so slots
+    connected to it may touch widgets.  ``fn`` must not.
+    """
+
+    # Keeps the signal carriers alive until their result is delivered
+    _active: set = set()
+
+    def __init__(self, fn, *args):
+        super().__init__()
+        self._fn = fn
+        self._args = args
+        self.signals = _TaskSignals()
+
+    def run(self):
+        try:
+            result = self._fn(*self._args)
+        except Exception as exc:
+            print(f"[BackgroundTask] {getattr(self._fn, '__name__', self._fn)} failed: {exc}")
+            result = None
+        self.signals.finished.emit(result)
+
+
+def run_in_background(fn, *args, on_done=None) -> BackgroundTask:
+    """Submit ``fn(*args)`` to the global pool; call ``on_done(result)`` when done."""
+    task = BackgroundTask(fn, *args)
+    signals = task.signals
+    if on_done is not None:
+        task.signals.finished.connect(on_done)
+    # Connected last so the carrier outlives delivery to on_done
+    BackgroundTask._active.add(signals)
+    signals.finished.connect(lambda _result: BackgroundTask._active.discard(signals))
+    QThreadPool.globalInstance().start(task)
+    return task
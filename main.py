@@ -13,10 +13,14 @@ from services.camera_service import CameraService
 from services.inspection_service import InspectionService
 from services.dataset_service import DatasetService
 from gui.main_window import MainWindow
+from gui.styles import DarkTheme
 
 
 def main() -> None:
     app = QApplication(sys.argv)
+    # Base colours for every window, dialog and popup; stylesheets only
+    # carry the rules a palette cannot express.
+    app.setPalette(DarkTheme.get_palette())
 
     # --- bootstrap services (no Qt dependency) ---
     settings = SettingsService()
@@ -4,6 +4,9 @@ Captures frames from the live camera feed as either a video file or
 a series of images.  No Qt dependency — pure Python + OpenCV.
 """
 
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -13,6 +16,16 @@ import numpy as np
 
 from services.settings_service import SettingsService
 
+# Image writes allowed in flight; frames arriving while all slots are busy
+# are skipped so a slow disk cannot queue unbounded full-resolution copies.
+_WRITE_WORKERS = 2
+_MAX_PENDING_WRITES = 2 * _WRITE_WORKERS
+
+# Lossless PNG at the fastest zlib level — dataset frames are written at
+# capture rate, and higher levels cost several times the CPU for a few
+# percent smaller files.
+_PNG_PARAMS = [cv2.IMWRITE_PNG_COMPRESSION, 1]
+
 
 class DatasetService:
     """Manages dataset collection (video recording or image capture).
@@ -42,6 +55,15 @@ class DatasetService:
         self._frames_saved: int = 0
         self._frame_skip: int = 5
 
+        # Image encode + write runs off the camera thread
+        self._write_pool = ThreadPoolExecutor(max_workers=_WRITE_WORKERS,
+                                              thread_name_prefix="dataset-write")
+        self._write_slots = threading.BoundedSemaphore(_MAX_PENDING_WRITES)
+        self._pending_lock = threading.Lock()
+        self._pending_writes: int = 0
+        # Recycled frame copies handed to the write pool (deque ops are atomic)
+        self._frame_pool: deque = deque(maxlen=4)
+
     # ---- properties --------------------------------------------------------
 
     @property
@@ -56,6 +78,11 @@ class DatasetService:
     def frames_saved(self) -> int:
         return self._frames_saved
 
+    @property
+    def pending_writes(self) -> int:
+        """Number of image files queued but not yet written to disk."""
+        return self._pending_writes
+
     @property
     def session_dir(self) -> Optional[Path]:
         return self._session_dir
@@ -106,8 +133,10 @@ class DatasetService:
             self._video_writer.release()
             self._video_writer = None
 
+        pending = self._pending_writes
+        queued = f" ({pending} still being written)" if pending else ""
         print(f"[DatasetService] Collection stopped — "
-              f"{self._frames_saved} frames saved to {self._session_dir}")
+              f"{self._frames_saved} frames captured to {self._session_dir}{queued}")
 
         self._is_collecting = False
 
@@ -148,16 +177,45 @@ class DatasetService:
         self._frames_saved += 1
 
     def _write_image_frame(self, frame: np.ndarray) -> None:
-        """Save *frame* as a PNG if the skip interval has elapsed."""
+        """Queue *frame* for saving as a PNG if the skip interval has elapsed."""
         if self._frame_counter % self._frame_skip != 0:
             return
+        if not self._write_slots.acquire(blocking=False):
+            return  # writer backlog full — drop this frame
 
         self._frames_saved += 1
         filename = f"{self._frames_saved:05d}.png"
         filepath = str(self._session_dir / filename)
 
+        # Copy before handing off — the caller may reuse the buffer
+        buf = self._acquire_buffer(frame)
+        np.copyto(buf, frame)
+        with self._pending_lock:
+            self._pending_writes += 1
+        self._write_pool.submit(self._write_image_file, filepath, buf)
+
+    def _acquire_buffer(self, frame: np.ndarray) -> np.ndarray:
+        """Return a pooled array shaped like *frame*, or a new one."""
+        try:
+            buf = self._frame_pool.popleft()
+        except IndexError:
+            return np.empty_like(frame)
+        if buf.shape != frame.shape or buf.dtype != frame.dtype:
+            return np.empty_like(frame)  # resolution changed — drop stale buffer
+        return buf
+
+    def _write_image_file(self, filepath: str, frame: np.ndarray) -> None:
+        """Encode and write one image (runs on the write pool)."""
         try:
-            cv2.imwrite(filepath, frame)
+            ok, buf = cv2.imencode(".png", frame, _PNG_PARAMS)
+            if not ok:
+                raise ValueError("PNG encoding failed")
+            Path(filepath).write_bytes(buf.tobytes())
         except Exception as exc:
             print(f"[DatasetService] Failed to write {filepath}: {exc}")
+        finally:
+            self._frame_pool.append(frame)
+            with self._pending_lock:
+                self._pending_writes -= 1
+            self._write_slots.release()
 
@@ -17,6 +17,11 @@ from services.camera_service import CameraService
 from services.settings_service import SettingsService
 from detector.tracker import ObjectTracker
 
+# Crops whose short side exceeds this multiple of the classifier's input
+# size are shrunk with a cheap area filter first so the processor's smooth
+# resize only sees a fraction of the pixels.
+_CLASSIFIER_PREFILTER_FACTOR = 2
+
 
 class InspectionService:
     """Orchestrates real-time inspection using camera frames + detector.
@@ -55,6 +60,9 @@ class InspectionService:
         self._annotated_lock = threading.Lock()
         self._latest_annotated_frame: Optional[np.ndarray] = None
 
+        # Reused BGR→RGB scratch frame (inference thread only)
+        self._rgb_buf: Optional[np.ndarray] = None
+
         # Background thread
         self._running = False
         self._thread: Optional[threading.Thread] = None
@@ -71,6 +79,8 @@ class InspectionService:
         # Classification results log: tracker_id → {label, score, timestamp}
         self._classification_log: Dict[int, Dict[str, Any]] = {}
         self._classification_log_lock = threading.Lock()
+        # Bumped on every log change so readers can skip unchanged snapshots
+        self._classification_log_version: int = 0
 
     # ---- properties --------------------------------------------------------
 
@@ -154,6 +164,7 @@ class InspectionService:
             self._tracker.clear_polygon()
         with self._classification_log_lock:
             self._classification_log.clear()
+            self._classification_log_version += 1
 
     def reset_roi_counts(self) -> None:
         """Reset zone counters without removing the polygon."""
@@ -180,6 +191,15 @@ class InspectionService:
         with self._classification_log_lock:
             return dict(self._classification_log)
 
+    @property
+    def classification_log_version(self) -> int:
+        """Counter that changes whenever the classification log changes.
+
+        Cheap to poll; compare it with the last seen value before taking
+        a :attr:`classification_log` snapshot.
+        """
+        return self._classification_log_version
+
     def load_classifier(self, model_path: str) -> bool:
         """Load a secondary classifier for two-stage ROI inspection.
 
@@ -224,11 +244,13 @@ class InspectionService:
             self._classifier = None
         with self._classification_log_lock:
             self._classification_log.clear()
+            self._classification_log_version += 1
 
     def clear_classification_log(self) -> None:
         """Clear the classification results log."""
         with self._classification_log_lock:
             self._classification_log.clear()
+            self._classification_log_version += 1
 
     # ---- model loading -----------------------------------------------------
 
@@ -297,14 +319,20 @@ class InspectionService:
         txt = os.path.join(parent, "classes.txt")
         jsn = os.path.join(parent, "classes.json")
 
-        if os.path.isfile(txt):
+        # Open directly instead of isfile() + open() — one syscall per
+        # candidate, and no window for the file to vanish in between.
+        try:
             with open(txt, "r", encoding="utf-8") as f:
                 return [line.strip() for line in f if line.strip()]
-        if os.path.isfile(jsn):
+        except (FileNotFoundError, IsADirectoryError):
+            pass
+        try:
             with open(jsn, "r", encoding="utf-8") as f:
                 data = json.load(f)
                 if isinstance(data, list):
                     return data
+        except (FileNotFoundError, IsADirectoryError):
+            pass
         return None
 
     # ---- frame submission --------------------------------------------------
@@ -361,6 +389,7 @@ class InspectionService:
             self._latest_annotated_frame = None
         with self._classification_log_lock:
             self._classification_log.clear()
+            self._classification_log_version += 1
 
     def _inference_loop(self) -> None:
         """Continuously grab the latest frame, run inference, store results.
@@ -454,8 +483,10 @@ class InspectionService:
         import cv2
         from PIL import Image
 
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        pil_img = Image.fromarray(rgb)
+        if self._rgb_buf is None or self._rgb_buf.shape != frame.shape:
+            self._rgb_buf = np.empty_like(frame)
+        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+        pil_img = Image.fromarray(rgb)  # PIL copies RGB data, so reuse is safe
         results = self._detector.predict([pil_img], top_k=1)
         return results[0] if results else []
 
@@ -521,6 +552,7 @@ class InspectionService:
                     det["classification"] = cls_result
                     with self._classification_log_lock:
                         self._classification_log[tid] = cls_result
+                        self._classification_log_version += 1
 
 
         return results
@@ -545,6 +577,14 @@ class InspectionService:
 
         try:
             crop = extract_object_crop(frame, box)
+            # Unknown input size → leave the crop to the processor as-is
+            input_size = getattr(classifier, "input_size", None)
+            limit = input_size * _CLASSIFIER_PREFILTER_FACTOR if input_size else 0
+            short_side = min(crop.shape[:2])
+            if limit and short_side > limit:
+                scale = limit / short_side
+                crop = cv2.resize(crop, None, fx=scale, fy=scale,
+                                  interpolation=cv2.INTER_AREA)
             rgb = cv2.cvtColor(crop, cv2.COLOR_BGR2RGB)
             pil_img = Image.fromarray(rgb)
             preds = classifier.predict([pil_img], top_k=1)